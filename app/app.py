@@ -1,16 +1,23 @@
 import asyncio
+import gzip
+import hashlib
+import hmac
 import logging
 import os
+import random
 import re
+import time
 from datetime import datetime, timezone
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
-from typing import Any, Awaitable, Callable, Dict, Optional
+from typing import Annotated, Any, AsyncIterator, Awaitable, Callable, Dict, Optional
 
 from fastapi import BackgroundTasks, Depends, FastAPI, Header, HTTPException, Response, status
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import AfterValidator, BaseModel, Field, ConfigDict, StringConstraints
 
-from .execs import run_cmd
+from .execs import reset_job_deadline, resolve_executable, run_cmd, set_job_deadline
 from .jobs import JobStore, utcnow_iso
+from .json_utils import FastJSONResponse, dumps_bytes
 from .k8s import build_quota_limitrange_yaml, build_scale_statefulsets_cmd
 from .parsers import parse_accounts_output
 from .rbac import apply_policy_if_configured, revoke_user_in_rbac_configmap
@@ -29,14 +36,68 @@ try:
     ADMIN_API_KEYS: Optional[Dict[str, str]] = _json.loads(_ADMIN_KEYS_JSON) if _ADMIN_KEYS_JSON else None
 except Exception:
     ADMIN_API_KEYS = None
+if not isinstance(ADMIN_API_KEYS, dict):
+    # Valid JSON that isn't an object (list, string, ...) is ignored like bad JSON
+    ADMIN_API_KEYS = None
+
+
+def _key_digest(value: str) -> bytes:
+    return hashlib.sha256(value.encode()).digest()
+
+
+# Precomputed digests: compare fixed-length values in constant time
+_ADMIN_API_KEY_DIGEST = _key_digest(ADMIN_API_KEY)
+_ADMIN_API_KEYS_DIGESTS: Dict[str, bytes] = {
+    str(kid): _key_digest(str(key)) for kid, key in (ADMIN_API_KEYS or {}).items() if key
+}
 
-app = FastAPI(title="Everest Bootstrap API", version="1.0.0")
+app = FastAPI(title="Everest Bootstrap API", version="1.0.0", default_response_class=FastJSONResponse)
 # Correlation/JSON access logs
 app.middleware("http")(correlation_middleware)
 jobs = JobStore()
 
+# Bound concurrently running jobs; each job spawns several CLI subprocesses.
+# Jobs waiting for a slot stay in "queued" status.
+_MAX_CONCURRENT_JOBS = max(1, int(os.environ.get("MAX_CONCURRENT_JOBS", "8")))
+_JOB_SEM = asyncio.Semaphore(_MAX_CONCURRENT_JOBS)
+# Overall wall-clock budget per job, counted from when it gets a slot. It is
+# deliberately below the sum of the per-step timeouts (operator conflict
+# retries alone can reach ~12 minutes) so a stuck job is cut short.
+_JOB_MAX_SECONDS = float(os.environ.get("JOB_MAX_SECONDS", "300"))
+
+
+async def _run_bounded(job_fn: Callable[..., Awaitable[None]], *args: Any) -> None:
+    """Run a job coroutine once a job slot is free."""
+    async with _JOB_SEM:
+        token = set_job_deadline(_JOB_MAX_SECONDS)
+        try:
+            await job_fn(*args)
+        finally:
+            reset_job_deadline(token)
+
 
-@dataclass
+async def _skipped_step() -> None:
+    """Placeholder for a disabled step in a _gather_or_cancel fan-out."""
+    return None
+
+
+async def _gather_or_cancel(*aws: Awaitable[Any]) -> list[Any]:
+    """asyncio.gather that, if one awaitable raises, cancels and awaits the rest.
+
+    Plain gather leaves the siblings running detached, so their CLI calls
+    and results would outlive the failed job.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+@dataclass(slots=True)
 class StepOutcome:
     """Helper structure encapsulating a bootstrap step outcome."""
 
@@ -46,42 +107,79 @@ class StepOutcome:
     meta: Dict[str, Any] = field(default_factory=dict)
 
 
+def _step_record(step: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "step_name": step.get("name"),
+        "command": step.get("command"),
+        "exit_code": step.get("exit_code"),
+        "stdout_preview": _preview_text(step.get("stdout")),
+        "stderr_preview": _preview_text(step.get("stderr")),
+    }
+
+
 def _log_job_step(job_id: str, step: Dict[str, Any]) -> None:
     """Emit a structured log line describing a job step outcome."""
 
-    logger.info(
-        "step",
-        extra={
-            "event": "job_step",
-            "job_id": job_id,
-            "step_name": step.get("name"),
-            "command": step.get("command"),
-            "exit_code": step.get("exit_code"),
-            "stdout_preview": _preview_text(step.get("stdout")),
-            "stderr_preview": _preview_text(step.get("stderr")),
-        },
-    )
+    logger.info("step", extra={"event": "job_step", "job_id": job_id, **_step_record(step)})
+
+
+# Buffered step records per "job_steps" log line
+_STEP_LOG_FLUSH_EVERY = 16
+
+
+class StepLog:
+    """Per-job step logger.
+
+    Successful steps are buffered and emitted together as one "job_steps"
+    line (on flush, or once flush_every records accumulate); failed steps
+    are logged immediately so they stay visible while a job is running.
+    """
+
+    __slots__ = ("job_id", "flush_every", "records")
+
+    def __init__(self, job_id: str, flush_every: int = _STEP_LOG_FLUSH_EVERY) -> None:
+        self.job_id = job_id
+        self.flush_every = flush_every
+        self.records: list[Dict[str, Any]] = []
+
+    def add(self, step: Dict[str, Any]) -> None:
+        # Output previews are only worth building if the record will be emitted
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        if step.get("exit_code") != 0:
+            _log_job_step(self.job_id, step)
+        else:
+            self.note(_step_record(step))
+
+    def note(self, record: Dict[str, Any]) -> None:
+        self.records.append(record)
+        if len(self.records) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.records:
+            logger.info(
+                "steps",
+                extra={"event": "job_steps", "job_id": self.job_id, "steps": self.records},
+            )
+            self.records = []
+
+
+# Password values following -p/--password (separate or "=" form)
+_PASSWORD_FLAG_RE = re.compile(r"(?<!\S)(-p|--password)(?:(\s+)|=)\S+")
+
+
+def _mask_password_flag(m: "re.Match[str]") -> str:
+    flag, sep = m.group(1), m.group(2)
+    return f"{flag}{sep}********" if sep is not None else f"{flag}=********"
 
 
 def _mask_command(cmd_str: str) -> str:
     """Mask password flags in a joined command string for safe logging."""
-    parts = cmd_str.split()
-    out = []
-    i = 0
-    while i < len(parts):
-        p = parts[i]
-        if p in ("-p", "--password") and i + 1 < len(parts):
-            out.append(p)
-            out.append("********")
-            i += 2
-            continue
-        if p.startswith("--password="):
-            out.append("--password=********")
-            i += 1
-            continue
-        out.append(p)
-        i += 1
-    return " ".join(out)
+    if "-p" not in cmd_str:
+        # Covers "--password" too; most commands carry no secret at all
+        return cmd_str
+    return _PASSWORD_FLAG_RE.sub(_mask_password_flag, cmd_str)
 
 
 def _preview_text(text: Optional[str], limit: int = 600) -> str:
@@ -92,6 +190,12 @@ def _preview_text(text: Optional[str], limit: int = 600) -> str:
     """
     if not text:
         return ""
+    if len(text) > limit * 2:
+        # Only the tail survives, so clean a bounded window instead of the
+        # whole (possibly very large) output; fall back if it cleans too short.
+        window = text[-limit * 2:].replace("\r", "").strip()
+        if len(window) >= limit:
+            return f"...omitted {len(text) - limit} chars...\n{window[-limit:]}"
     s = text.replace("\r", "")
     s = s.strip()
     if len(s) <= limit:
@@ -109,32 +213,45 @@ async def require_admin_key(
     if ADMIN_API_KEYS:
         if not (x_admin_kid and x_admin_key):
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
-        expected = ADMIN_API_KEYS.get(x_admin_kid)
-        if not expected or x_admin_key != expected:
+        expected = _ADMIN_API_KEYS_DIGESTS.get(x_admin_kid)
+        if expected is None or not hmac.compare_digest(_key_digest(x_admin_key), expected):
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
         return
     # Fallback single key
-    if not x_admin_key or x_admin_key != ADMIN_API_KEY:
+    if not x_admin_key or not hmac.compare_digest(_key_digest(x_admin_key), _ADMIN_API_KEY_DIGEST):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
 
 
-_K8S_NAME_RE = re.compile(r"^[a-z0-9]([-a-z0-9]*[a-z0-9])?$")
-_NAMESPACE_DENYLIST = {"kube-system", "kube-public", "default", "everest-system", "kube-node-lease"}
+# Shared route dependencies for protected endpoints
+_ADMIN_DEPS = [Depends(require_admin_key)]
+
 
+# RFC 1123 label, enforced by the request models' field constraints. The
+# pattern runs in pydantic-core, whose "$" does not match before a trailing
+# newline, so "alice\n" is rejected.
+_K8S_NAME_PATTERN = r"^[a-z0-9](?:[-a-z0-9]*[a-z0-9])?$"
+_NAMESPACE_DENYLIST = frozenset({"kube-system", "kube-public", "default", "everest-system", "kube-node-lease"})
+# Optional allowed namespace prefixes, parsed once (str.startswith takes a tuple)
+_ALLOWED_NS_PREFIXES: tuple[str, ...] = tuple(
+    p.strip() for p in os.environ.get("ALLOWED_NAMESPACE_PREFIXES", "").split(",") if p.strip()
+)
 
-def _validate_k8s_name(value: str, field_name: str) -> str:
-    if not _K8S_NAME_RE.match(value):
-        raise ValueError(f"{field_name} must match RFC 1123 label (lowercase alphanumerics and -)")
-    if field_name == "namespace" and value in _NAMESPACE_DENYLIST:
+
+def _check_namespace_policy(value: str) -> str:
+    """Denylist/prefix checks for a namespace already matching RFC 1123."""
+    if value in _NAMESPACE_DENYLIST:
         raise ValueError("namespace is not allowed")
-    # Optional allowed prefixes
-    prefixes = [p.strip() for p in os.environ.get("ALLOWED_NAMESPACE_PREFIXES", "").split(",") if p.strip()]
-    if field_name == "namespace" and prefixes:
-        if not any(value.startswith(p) for p in prefixes):
-            raise ValueError("namespace prefix not allowed")
+    if _ALLOWED_NS_PREFIXES and not value.startswith(_ALLOWED_NS_PREFIXES):
+        raise ValueError("namespace prefix not allowed")
     return value
 
 
+# Shared field types, so every request model reuses one core schema per field
+_K8sName = Annotated[str, StringConstraints(min_length=1, max_length=63, pattern=_K8S_NAME_PATTERN)]
+UserName = _K8sName
+NamespaceName = Annotated[_K8sName, AfterValidator(_check_namespace_policy)]
+
+
 class OperatorFlags(BaseModel):
     model_config = ConfigDict(extra="forbid")
     mongodb: bool = False
@@ -155,98 +272,108 @@ class Resources(BaseModel):
 
 class BootstrapRequest(BaseModel):
     model_config = ConfigDict(extra="forbid")
-    username: str = Field(..., min_length=1, max_length=63)
-    namespace: Optional[str] = Field(default=None, min_length=1, max_length=63)
-    operators: OperatorFlags = Field(default_factory=OperatorFlags)
+    username: UserName
+    namespace: Optional[NamespaceName] = None
+    operators: OperatorFlags = Field(default_factory=OperatorFlags.model_construct)
     take_ownership: bool = False
-    resources: Resources = Field(default_factory=Resources)
+    resources: Resources = Field(default_factory=Resources.model_construct)
     # Optional initial password. If omitted, the API uses
     # BOOTSTRAP_DEFAULT_PASSWORD env or generates a strong one.
     password: Optional[str] = None
 
-    @field_validator("username")
-    @classmethod
-    def _val_user(cls, v: str) -> str:
-        return _validate_k8s_name(v, "username")
-
-    @field_validator("namespace")
-    @classmethod
-    def _val_ns(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return v
-        return _validate_k8s_name(v, "namespace")
-
 
 class PasswordChangeRequest(BaseModel):
     model_config = ConfigDict(extra="forbid")
-    username: str = Field(..., min_length=1, max_length=63)
+    username: UserName
     new_password: str = Field(..., min_length=1, max_length=256)
 
-    @field_validator("username")
-    @classmethod
-    def _val_user(cls, v: str) -> str:
-        return _validate_k8s_name(v, "username")
-
 
 class NamespaceResourceUpdate(BaseModel):
     model_config = ConfigDict(extra="forbid")
-    namespace: str = Field(..., min_length=1, max_length=63)
-    resources: Resources = Field(default_factory=Resources)
-
-    @field_validator("namespace")
-    @classmethod
-    def _val_ns(cls, v: str) -> str:
-        return _validate_k8s_name(v, "namespace")
+    namespace: NamespaceName
+    resources: Resources = Field(default_factory=Resources.model_construct)
 
 
 class NamespaceOperatorsUpdate(BaseModel):
     model_config = ConfigDict(extra="forbid")
-    namespace: str = Field(..., min_length=1, max_length=63)
-    operators: OperatorFlags = Field(default_factory=OperatorFlags)
-
-    @field_validator("namespace")
-    @classmethod
-    def _val_ns(cls, v: str) -> str:
-        return _validate_k8s_name(v, "namespace")
+    namespace: NamespaceName
+    operators: OperatorFlags = Field(default_factory=OperatorFlags.model_construct)
 
 
 class SuspendUserRequest(BaseModel):
     model_config = ConfigDict(extra="forbid")
-    username: str = Field(..., min_length=1, max_length=63)
-    namespace: Optional[str] = Field(default=None, min_length=1, max_length=63)
+    username: UserName
+    namespace: Optional[NamespaceName] = None
     scale_statefulsets: bool = True
     revoke_rbac: bool = True
 
-    @field_validator("username")
-    @classmethod
-    def _val_user(cls, v: str) -> str:
-        return _validate_k8s_name(v, "username")
-
-    @field_validator("namespace")
-    @classmethod
-    def _val_ns(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return v
-        return _validate_k8s_name(v, "namespace")
-
 
 class DeleteUserRequest(BaseModel):
     model_config = ConfigDict(extra="forbid")
-    username: str = Field(..., min_length=1, max_length=63)
-    namespace: Optional[str] = Field(default=None, min_length=1, max_length=63)
+    username: UserName
+    namespace: Optional[NamespaceName] = None
     delete_account: bool = True
 
-    @field_validator("username")
-    @classmethod
-    def _val_user(cls, v: str) -> str:
-        return _validate_k8s_name(v, "username")
 
-    @field_validator("namespace")
-    @classmethod
-    def _val_ns(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return v
-        return _validate_k8s_name(v, "namespace")
+# Constant CLI prefixes; per-call arguments are appended at the call site
+_CMD_ACCOUNTS_CREATE = ("everestctl", "accounts", "create", "-u")
+_CMD_ACCOUNTS_SET_PASSWORD = ("everestctl", "accounts", "set-password", "-u")
+_CMD_NS_ADD = ("everestctl", "namespaces", "add")
+_CMD_NS_UPDATE = ("everestctl", "namespaces", "update")
+# CLI spelling of a boolean flag value, indexed by the bool
+_BOOL_STR = ("false", "true")
+
+# CLI output markers, matched per stream without lowercasing copies.
+# "exists" also covers "already exists" / "user exists".
+_EXISTS_RE = re.compile(r"exists|already present", re.IGNORECASE)
+_UNKNOWN_FLAG_RE = re.compile(r"unknown flag", re.IGNORECASE)
+# Both phrases, in either order; anchored so a miss costs one linear scan
+_TRANSIENT_CONFLICT_RE = re.compile(
+    r"\A(?=.*?another operation)(?=.*?in progress)", re.IGNORECASE | re.DOTALL
+)
+
+
+def _output_matches(res: Dict[str, Any], pattern: "re.Pattern[str]") -> bool:
+    """Return True if pattern occurs in the result's stderr or stdout."""
+    return bool(
+        pattern.search(res.get("stderr") or "")
+        or pattern.search(res.get("stdout") or "")
+    )
+
+
+def _everestctl_key() -> str:
+    # The executable run_cli actually runs; resolved once per process
+    return resolve_executable("everestctl")
+
+
+# Whether an everestctl binary (by resolved path) takes the legacy
+# --operator.xtradb-cluster flag rather than --operator.mysql
+_legacy_mysql_flag: Dict[str, bool] = {}
+
+
+async def _run_with_mysql_flag(
+    cmd: list[str], mysql: bool, xtradb_cluster: bool, *, timeout: int
+) -> tuple[Dict[str, Any], bool]:
+    """Run cmd with the MySQL operator flag form this CLI accepts.
+
+    The form that last worked for the binary goes first; on "unknown flag"
+    the other form is tried. Returns the result and whether the legacy
+    flag was used.
+    """
+    key = _everestctl_key()
+    legacy = _legacy_mysql_flag.get(key, False)
+    for attempt in range(2):
+        if legacy:
+            flag = f"--operator.xtradb-cluster={_BOOL_STR[bool(xtradb_cluster)]}"
+        else:
+            flag = f"--operator.mysql={_BOOL_STR[bool(mysql)]}"
+        res = await run_cmd([*cmd, flag], timeout=timeout)
+        if attempt or res.get("exit_code") == 0 or not _output_matches(res, _UNKNOWN_FLAG_RE):
+            break
+        legacy = not legacy
+    if res.get("exit_code") == 0:
+        _legacy_mysql_flag[key] = legacy
+    return res, legacy
 
 
 async def _create_account(req: BootstrapRequest) -> StepOutcome:
@@ -261,17 +388,9 @@ async def _create_account(req: BootstrapRequest) -> StepOutcome:
         generated_password = secrets.token_urlsafe(16)
         chosen_password = generated_password
 
-    cmd = [
-        "everestctl",
-        "accounts",
-        "create",
-        "-u",
-        req.username,
-        "-p",
-        chosen_password,
-    ]
+    cmd = [*_CMD_ACCOUNTS_CREATE, req.username, "-p", chosen_password]
     res = await run_cmd(cmd, timeout=60)
-    res.update({"name": "create_account"})
+    res["name"] = "create_account"
     if "command" in res:
         res["command"] = _mask_command(res["command"])  # type: ignore[index]
 
@@ -285,8 +404,7 @@ async def _create_account(req: BootstrapRequest) -> StepOutcome:
     }
 
     if not succeeded:
-        msg = (res.get("stderr", "") + res.get("stdout", "")).lower()
-        if "already exists" in msg or "user exists" in msg or "exists" in msg:
+        if _output_matches(res, _EXISTS_RE):
             res["exit_code"] = 0
             res["stdout"] = (
                 res.get("stdout", "")
@@ -314,56 +432,40 @@ async def _create_account(req: BootstrapRequest) -> StepOutcome:
     )
 
 
+# Default operators are process config; parse them once
+_DEFAULT_OPERATORS = frozenset(
+    s.strip().lower()
+    for s in os.environ.get("BOOTSTRAP_DEFAULT_OPERATORS", "postgresql").split(",")
+    if s.strip()
+)
+_DEFAULT_WANTS_MYSQL = not _DEFAULT_OPERATORS.isdisjoint({"mysql", "xtradb_cluster", "xtradb-cluster"})
+
+
 async def _ensure_namespace(req: BootstrapRequest, namespace: str) -> StepOutcome:
     """Ensure the target namespace exists with the correct operators enabled."""
 
     operators = req.operators
-    def_ops = os.environ.get("BOOTSTRAP_DEFAULT_OPERATORS", "postgresql")
-    def_set = {s.strip().lower() for s in def_ops.split(",") if s.strip()}
     enable_mongodb = bool(operators.mongodb)
     enable_postgresql = bool(operators.postgresql)
     want_mysql_like = (
         (operators.mysql is True)
         or operators.xtradb_cluster
-        or ("mysql" in def_set)
-        or ("xtradb_cluster" in def_set)
-        or ("xtradb-cluster" in def_set)
+        or _DEFAULT_WANTS_MYSQL
     )
     if not any([enable_mongodb, enable_postgresql, want_mysql_like]):
         enable_postgresql = True
 
-    new_cli_cmd = [
-        "everestctl",
-        "namespaces",
-        "add",
+    cli_cmd = [
+        *_CMD_NS_ADD,
         namespace,
-        f"--operator.mongodb={'true' if enable_mongodb else 'false'}",
-        f"--operator.postgresql={'true' if enable_postgresql else 'false'}",
+        f"--operator.mongodb={_BOOL_STR[enable_mongodb]}",
+        f"--operator.postgresql={_BOOL_STR[enable_postgresql]}",
     ]
-    new_cli_cmd.append(f"--operator.mysql={'true' if want_mysql_like else 'false'}")
     if req.take_ownership:
-        new_cli_cmd.append("--take-ownership")
-
-    res = await run_cmd(new_cli_cmd, timeout=120)
-    res.update({"name": "add_namespace"})
-
-    if res.get("exit_code") != 0 and (
-        "unknown flag" in res.get("stderr", "").lower()
-        or "unknown flag" in res.get("stdout", "").lower()
-    ):
-        old_cli_cmd = [
-            "everestctl",
-            "namespaces",
-            "add",
-            namespace,
-            f"--operator.mongodb={'true' if enable_mongodb else 'false'}",
-            f"--operator.postgresql={'true' if enable_postgresql else 'false'}",
-            f"--operator.xtradb-cluster={'true' if want_mysql_like else 'false'}",
-        ]
-        if req.take_ownership:
-            old_cli_cmd.append("--take-ownership")
-        res = await run_cmd(old_cli_cmd, timeout=120)
-        res.update({"name": "add_namespace"})
+        cli_cmd.append("--take-ownership")
+
+    res, _ = await _run_with_mysql_flag(cli_cmd, want_mysql_like, want_mysql_like, timeout=120)
+    res["name"] = "add_namespace"
 
     succeeded = res.get("exit_code") == 0
     namespace_existed = False
@@ -371,8 +473,7 @@ async def _ensure_namespace(req: BootstrapRequest, namespace: str) -> StepOutcom
     meta = {"namespace_existed": namespace_existed}
 
     if not succeeded:
-        msg = (res.get("stderr", "") + res.get("stdout", "")).lower()
-        if "already exists" in msg or "exists" in msg or "already present" in msg:
+        if _output_matches(res, _EXISTS_RE):
             res["exit_code"] = 0
             res["stdout"] = (
                 res.get("stdout", "")
@@ -433,18 +534,41 @@ async def _apply_rbac_policy(username: str, namespace: str) -> StepOutcome:
     return StepOutcome(result=res, succeeded=True)
 
 
-@app.get("/healthz")
-async def healthz():
-    return {"ok": True, "time": datetime.now(timezone.utc).isoformat()}
+# Probe bodies: /readyz is constant, /healthz is re-rendered at most once per second
+_READYZ_BODY = dumps_bytes({"ok": True})
+_healthz_cache: list[Any] = [None, b""]  # [epoch second, body]
+
+
+@app.get("/healthz", response_model=None)
+async def healthz() -> Response:
+    now_s = int(time.time())
+    if _healthz_cache[0] != now_s:
+        ts = datetime.fromtimestamp(now_s, timezone.utc).isoformat()
+        _healthz_cache[0] = now_s
+        _healthz_cache[1] = dumps_bytes({"ok": True, "time": ts})
+    return Response(content=_healthz_cache[1], media_type="application/json")
+
+
+@app.get("/readyz", response_model=None)
+async def readyz() -> Response:
+    return Response(content=_READYZ_BODY, media_type="application/json")
 
 
-@app.get("/readyz")
-async def readyz():
-    return {"ok": True}
+def _job_accepted(job_id: str) -> Response:
+    """202 body for job submissions, rendered directly (no response-model pass)."""
+    return FastJSONResponse(
+        {"job_id": job_id, "status_url": f"/jobs/{job_id}"},
+        status_code=status.HTTP_202_ACCEPTED,
+    )
 
 
-@app.post("/bootstrap/users", status_code=status.HTTP_202_ACCEPTED, dependencies=[Depends(require_admin_key)])
-async def submit_bootstrap(req: BootstrapRequest, background: BackgroundTasks):
+@app.post(
+    "/bootstrap/users",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=None,
+    dependencies=_ADMIN_DEPS,
+)
+async def submit_bootstrap(req: BootstrapRequest, background: BackgroundTasks) -> Response:
     ns = req.namespace or req.username
     job = await jobs.create()
     logger.info(
@@ -464,12 +588,14 @@ async def submit_bootstrap(req: BootstrapRequest, background: BackgroundTasks):
             extra={"event": "job_started", "job_id": job.job_id, "username": req.username, "namespace": ns},
         )
         steps: list[Dict[str, Any]] = []
+        # Dumped once; shared by the job inputs and the quota step
+        resources = req.resources.model_dump()
         inputs = {
             "username": req.username,
             "namespace": ns,
             "operators": req.operators.model_dump(),
             "take_ownership": req.take_ownership,
-            "resources": req.resources.model_dump(),
+            "resources": resources,
         }
 
         overall_status = "succeeded"
@@ -482,83 +608,79 @@ async def submit_bootstrap(req: BootstrapRequest, background: BackgroundTasks):
         account_existed = False
         namespace_existed = False
 
+        step_log = StepLog(job.job_id)
+
         try:
-            async def _log_and_record(outcome: StepOutcome) -> None:
+            def _record(outcome: StepOutcome) -> None:
                 steps.append(outcome.result)
-                logger.info(
-                    "step",
-                    extra={
-                        "event": "job_step",
-                        "job_id": job.job_id,
-                        "step_name": outcome.result.get("name"),
-                        "command": outcome.result.get("command"),
-                        "exit_code": outcome.result.get("exit_code"),
-                        "stdout_preview": _preview_text(outcome.result.get("stdout")),
-                        "stderr_preview": _preview_text(outcome.result.get("stderr")),
-                    },
-                )
-
-            steps_plan: list[
-                tuple[
-                    str,
-                    Callable[[], Awaitable[StepOutcome]],
-                    Callable[[str], bool],
-                    bool,
-                ]
-            ] = [
-                (
-                    "create_account",
-                    lambda: _create_account(req),
-                    lambda status: True,
-                    True,
-                ),
-                (
-                    "add_namespace",
-                    lambda: _ensure_namespace(req, ns),
-                    lambda status: status == "succeeded",
-                    True,
-                ),
-                (
-                    "apply_resource_quota",
-                    lambda: _apply_resource_quota(ns, req.resources.model_dump()),
-                    lambda status: status == "succeeded",
-                    True,
-                ),
-                (
-                    "apply_rbac_policy",
-                    lambda: _apply_rbac_policy(req.username, ns),
-                    lambda status: True,
-                    False,
-                ),
+                step_log.add(outcome.result)
+
+            # Stages run in order; steps inside a stage only depend on earlier
+            # stages, so they run concurrently. Results are recorded in the
+            # declared order to keep the job result stable.
+            StepSpec = tuple[
+                str,
+                Callable[[], Awaitable[StepOutcome]],
+                Callable[[str], bool],
+                bool,
+            ]
+            steps_plan: list[list[StepSpec]] = [
+                [
+                    (
+                        "create_account",
+                        lambda: _create_account(req),
+                        lambda status: True,
+                        True,
+                    ),
+                ],
+                [
+                    (
+                        "add_namespace",
+                        lambda: _ensure_namespace(req, ns),
+                        lambda status: status == "succeeded",
+                        True,
+                    ),
+                ],
+                [
+                    (
+                        "apply_resource_quota",
+                        lambda: _apply_resource_quota(ns, resources),
+                        lambda status: status == "succeeded",
+                        True,
+                    ),
+                    (
+                        "apply_rbac_policy",
+                        lambda: _apply_rbac_policy(req.username, ns),
+                        lambda status: True,
+                        False,
+                    ),
+                ],
             ]
 
-            for _step_name, step_factory, should_run, affects_status in steps_plan:
-                if not should_run(overall_status):
+            for stage in steps_plan:
+                runnable = [spec for spec in stage if spec[2](overall_status)]
+                if not runnable:
                     continue
-                outcome: StepOutcome = await step_factory()
-                await _log_and_record(outcome)
-                adjustment = outcome.meta.get("log_adjustment")
-                if adjustment:
-                    logger.info(
-                        "step",
-                        extra={
-                            "event": "job_step_adjusted",
-                            "job_id": job.job_id,
-                            **adjustment,
-                        },
-                    )
-                if (
-                    affects_status
-                    and not outcome.succeeded
-                    and overall_status == "succeeded"
-                ):
-                    overall_status = "failed"
-                    if outcome.failure_summary:
-                        summary.append(outcome.failure_summary)
-                account_existed = account_existed or outcome.meta.get("account_existed", False)
-                namespace_existed = namespace_existed or outcome.meta.get("namespace_existed", False)
-                if "generated_password" in outcome.meta and outcome.meta["generated_password"]:
-                    generated_password = outcome.meta["generated_password"]
+                outcomes: list[StepOutcome] = await _gather_or_cancel(
+                    *(step_factory() for _name, step_factory, _should_run, _affects in runnable)
+                )
+                for (_step_name, _factory, _should_run, affects_status), outcome in zip(runnable, outcomes):
+                    _record(outcome)
+                    adjustment = outcome.meta.get("log_adjustment")
+                    if adjustment:
+                        step_log.note({"event": "job_step_adjusted", **adjustment})
+                    if (
+                        affects_status
+                        and not outcome.succeeded
+                        and overall_status == "succeeded"
+                    ):
+                        overall_status = "failed"
+                        if outcome.failure_summary:
+                            summary.append(outcome.failure_summary)
+                    account_existed = account_existed or outcome.meta.get("account_existed", False)
+                    namespace_existed = namespace_existed or outcome.meta.get("namespace_existed", False)
+                    if "generated_password" in outcome.meta and outcome.meta["generated_password"]:
+                        generated_password = outcome.meta["generated_password"]
 
             rbac_step = steps[-1] if steps else {}
 
@@ -590,12 +712,15 @@ async def submit_bootstrap(req: BootstrapRequest, background: BackgroundTasks):
             logger.exception("Bootstrap job failed")
             summary.append("internal error")
         finally:
+            _invalidate_accounts_cache()
+            step_log.flush()
+            summary_text = "; ".join(summary) if summary else overall_status
             # Build result payload and include generated credentials (if any)
             result_payload = {
                 "inputs": inputs,
                 "steps": steps,
                 "overall_status": overall_status,
-                "summary": "; ".join(summary) if summary else overall_status,
+                "summary": summary_text,
             }
             if generated_password:
                 result_payload["credentials"] = {"username": req.username, "password": generated_password}
@@ -604,7 +729,7 @@ async def submit_bootstrap(req: BootstrapRequest, background: BackgroundTasks):
                 job.job_id,
                 status=overall_status,
                 finished_at=utcnow_iso(),
-                summary="; ".join(summary) if summary else overall_status,
+                summary=summary_text,
                 result=result_payload,
             )
             logger.info(
@@ -613,34 +738,58 @@ async def submit_bootstrap(req: BootstrapRequest, background: BackgroundTasks):
                     "event": "job_finished",
                     "job_id": job.job_id,
                     "status": overall_status,
-                    "summary": "; ".join(summary) if summary else overall_status,
+                    "summary": summary_text,
                 },
             )
 
-    background.add_task(_run)
-    return {"job_id": job.job_id, "status_url": f"/jobs/{job.job_id}"}
+    background.add_task(_run_bounded, _run)
+    return _job_accepted(job.job_id)
 
 
-@app.get("/jobs/{job_id}", dependencies=[Depends(require_admin_key)])
-async def job_status(job_id: str):
-    data = await jobs.serialize(job_id)
-    if not data:
+# Read endpoints below return JSON-native dicts; wrapping them in a response
+# directly skips FastAPI's jsonable_encoder pass over (large) job payloads.
+@app.get("/jobs/{job_id}", response_model=None, dependencies=_ADMIN_DEPS)
+async def job_status(job_id: str) -> Response:
+    body = await jobs.serialize_json(job_id)
+    if body is None:
         raise HTTPException(status_code=404, detail="job not found")
-    return data
+    return Response(content=body, media_type="application/json")
 
 
-@app.get("/jobs/{job_id}/result", dependencies=[Depends(require_admin_key)])
-async def job_result(job_id: str):
+@app.get("/jobs/{job_id}/result", response_model=None, dependencies=_ADMIN_DEPS)
+async def job_result(job_id: str) -> Response:
     job = await jobs.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="job not found")
     if job.status not in ("succeeded", "failed"):
         raise HTTPException(status_code=409, detail="job not finished")
-    return job.result
+    return Response(content=jobs.result_json(job), media_type="application/json")
+
+
+# Short-lived cache for GET /accounts/list; concurrent callers share one CLI run
+_ACCOUNTS_CACHE_TTL = float(os.environ.get("ACCOUNTS_LIST_CACHE_TTL", "2"))
+_accounts_cache: Optional[tuple[float, Dict[str, Any]]] = None
+_accounts_lock = asyncio.Lock()
+# Bumped on every invalidation; a fetch that started under an older
+# generation may predate the change and is not cached
+_accounts_generation = 0
+
+
+def _invalidate_accounts_cache() -> None:
+    """Drop the cached accounts listing after a job that changes accounts."""
+    global _accounts_cache, _accounts_generation
+    _accounts_cache = None
+    _accounts_generation += 1
+
 
+def _cached_accounts() -> Optional[Dict[str, Any]]:
+    cached = _accounts_cache
+    if cached and time.monotonic() - cached[0] < _ACCOUNTS_CACHE_TTL:
+        return cached[1]
+    return None
 
-@app.get("/accounts/list", dependencies=[Depends(require_admin_key)])
-async def accounts_list():
+
+async def _fetch_accounts_list() -> Dict[str, Any]:
     # Try JSON first
     res = await run_cmd(["everestctl", "accounts", "list", "--json"], timeout=30)
     if res["exit_code"] == 0:
@@ -665,6 +814,24 @@ async def accounts_list():
     raise HTTPException(status_code=502, detail={"error": "everestctl failed", "detail": detail[-4000:]})
 
 
+@app.get("/accounts/list", response_model=None, dependencies=_ADMIN_DEPS)
+async def accounts_list() -> Response:
+    global _accounts_cache
+    cached = _cached_accounts()
+    if cached is not None:
+        return FastJSONResponse(cached)
+    async with _accounts_lock:
+        # Another caller may have refreshed the cache while we waited
+        cached = _cached_accounts()
+        if cached is not None:
+            return FastJSONResponse(cached)
+        generation = _accounts_generation
+        data = await _fetch_accounts_list()
+        if _ACCOUNTS_CACHE_TTL > 0 and generation == _accounts_generation:
+            _accounts_cache = (time.monotonic(), data)
+        return FastJSONResponse(data)
+
+
 async def _set_account_password_job(job_id: str, req: PasswordChangeRequest) -> None:
     await jobs.update(job_id, status="running", started_at=utcnow_iso())
     logger.info(
@@ -673,6 +840,7 @@ async def _set_account_password_job(job_id: str, req: PasswordChangeRequest) ->
     )
 
     steps: list[Dict[str, Any]] = []
+    step_log = StepLog(job_id)
     inputs = {"username": req.username}
     overall_status = "succeeded"
     error_detail: Optional[str] = None
@@ -680,38 +848,24 @@ async def _set_account_password_job(job_id: str, req: PasswordChangeRequest) ->
     try:
         input_text = f"{req.new_password}\n{req.new_password}\n"
         primary = await run_cmd(
-            [
-                "everestctl",
-                "accounts",
-                "set-password",
-                "-u",
-                req.username,
-            ],
+            [*_CMD_ACCOUNTS_SET_PASSWORD, req.username],
             timeout=60,
             input_text=input_text,
         )
-        primary.update({"name": "set_password_stdin"})
+        primary["name"] = "set_password_stdin"
         steps.append(primary)
-        _log_job_step(job_id, primary)
+        step_log.add(primary)
 
         if primary.get("exit_code") != 0:
             fallback = await run_cmd(
-                [
-                    "everestctl",
-                    "accounts",
-                    "set-password",
-                    "-u",
-                    req.username,
-                    "-p",
-                    req.new_password,
-                ],
+                [*_CMD_ACCOUNTS_SET_PASSWORD, req.username, "-p", req.new_password],
                 timeout=60,
             )
             if "command" in fallback:
                 fallback["command"] = _mask_command(fallback["command"])  # type: ignore[index]
-            fallback.update({"name": "set_password_flag"})
+            fallback["name"] = "set_password_flag"
             steps.append(fallback)
-            _log_job_step(job_id, fallback)
+            step_log.add(fallback)
 
             if fallback.get("exit_code") != 0:
                 overall_status = "failed"
@@ -729,7 +883,7 @@ async def _set_account_password_job(job_id: str, req: PasswordChangeRequest) ->
             "stderr": str(exc),
         }
         steps.append(step)
-        _log_job_step(job_id, step)
+        step_log.add(step)
         logger.exception("Password job failed", extra={"event": "job_failed", "job_id": job_id})
     finally:
         summary_text = (
@@ -755,6 +909,7 @@ async def _set_account_password_job(job_id: str, req: PasswordChangeRequest) ->
             summary=summary_text,
             result=result_payload,
         )
+        step_log.flush()
         logger.info(
             "job finished",
             extra={
@@ -774,17 +929,19 @@ async def _update_namespace_resources_job(job_id: str, req: NamespaceResourceUpd
     )
 
     steps: list[Dict[str, Any]] = []
+    step_log = StepLog(job_id)
     overall_status = "succeeded"
     outcome_summary = f"Resource quota applied for namespace {req.namespace}"
+    resources = req.resources.model_dump()
     inputs = {
         "namespace": req.namespace,
-        "resources": req.resources.model_dump(),
+        "resources": resources,
     }
 
     try:
-        outcome = await _apply_resource_quota(req.namespace, req.resources.model_dump())
+        outcome = await _apply_resource_quota(req.namespace, resources)
         steps.append(outcome.result)
-        _log_job_step(job_id, outcome.result)
+        step_log.add(outcome.result)
         if not outcome.succeeded:
             overall_status = "failed"
             outcome_summary = outcome.failure_summary or "Resource quota apply failed"
@@ -799,7 +956,7 @@ async def _update_namespace_resources_job(job_id: str, req: NamespaceResourceUpd
             "stderr": str(exc),
         }
         steps.append(step)
-        _log_job_step(job_id, step)
+        step_log.add(step)
         logger.exception(
             "Namespace resources job failed",
             extra={"event": "job_failed", "job_id": job_id},
@@ -821,6 +978,7 @@ async def _update_namespace_resources_job(job_id: str, req: NamespaceResourceUpd
             summary=outcome_summary,
             result=result_payload,
         )
+        step_log.flush()
         logger.info(
             "job finished",
             extra={
@@ -836,46 +994,24 @@ async def _update_namespace_operators_once(
     req: NamespaceOperatorsUpdate,
 ) -> StepOutcome:
     ops = req.operators
-    new_cli_cmd = [
-        "everestctl",
-        "namespaces",
-        "update",
+    cli_cmd = [
+        *_CMD_NS_UPDATE,
         req.namespace,
-        f"--operator.mongodb={'true' if ops.mongodb else 'false'}",
-        f"--operator.postgresql={'true' if ops.postgresql else 'false'}",
+        f"--operator.mongodb={_BOOL_STR[bool(ops.mongodb)]}",
+        f"--operator.postgresql={_BOOL_STR[bool(ops.postgresql)]}",
     ]
-    if ops.mysql is not None:
-        new_cli_cmd.append(f"--operator.mysql={'true' if ops.mysql else 'false'}")
-    else:
-        new_cli_cmd.append("--operator.mysql=false")
-    res = await run_cmd(new_cli_cmd, timeout=120)
-
-    used_legacy_cli = False
-    if res.get("exit_code") != 0 and (
-        "unknown flag" in res.get("stderr", "").lower()
-        or "unknown flag" in res.get("stdout", "").lower()
-    ):
-        old_cli_cmd = [
-            "everestctl",
-            "namespaces",
-            "update",
-            req.namespace,
-            f"--operator.mongodb={'true' if ops.mongodb else 'false'}",
-            f"--operator.postgresql={'true' if ops.postgresql else 'false'}",
-            f"--operator.xtradb-cluster={'true' if ops.xtradb_cluster else 'false'}",
-        ]
-        res = await run_cmd(old_cli_cmd, timeout=120)
-        used_legacy_cli = True
-
-    res.update({"name": "update_namespace_operators"})
+    res, used_legacy_cli = await _run_with_mysql_flag(
+        cli_cmd, bool(ops.mysql), ops.xtradb_cluster, timeout=120
+    )
+
+    res["name"] = "update_namespace_operators"
     succeeded = res.get("exit_code") == 0
     failure_summary: Optional[str] = None
     meta: Dict[str, Any] = {"used_legacy_cli": used_legacy_cli}
 
     if not succeeded:
         msg = (res.get("stderr", "") + "\n" + res.get("stdout", "")).strip()
-        lowered = msg.lower()
-        if "another operation" in lowered and "in progress" in lowered:
+        if _output_matches(res, _TRANSIENT_CONFLICT_RE):
             meta["transient_conflict"] = True
             failure_summary = "Another operation is in progress"
         else:
@@ -886,6 +1022,52 @@ async def _update_namespace_operators_once(
     return StepOutcome(result=res, succeeded=succeeded, failure_summary=failure_summary, meta=meta)
 
 
+# In-process per-namespace locks: namespace -> [lock, holders + waiters].
+# Entries are dropped once nobody holds or waits on them.
+_ns_locks: Dict[str, list] = {}
+
+
+@asynccontextmanager
+async def _namespace_lock(namespace: str) -> AsyncIterator[None]:
+    entry = _ns_locks.get(namespace)
+    if entry is None:
+        entry = _ns_locks[namespace] = [asyncio.Lock(), 0]
+    entry[1] += 1
+    try:
+        async with entry[0]:
+            yield
+    finally:
+        entry[1] -= 1
+        if entry[1] == 0:
+            _ns_locks.pop(namespace, None)
+
+
+# Retry policy for operator updates blocked by another namespace operation
+_OPERATORS_RETRY_ATTEMPTS = max(1, int(os.environ.get("OPERATORS_RETRY_ATTEMPTS", "3")))
+_OPERATORS_RETRY_BASE = float(os.environ.get("OPERATORS_RETRY_BASE_SECONDS", "2"))
+_OPERATORS_RETRY_CAP = float(os.environ.get("OPERATORS_RETRY_CAP_SECONDS", "30"))
+
+
+def _conflict_backoff(attempt: int) -> float:
+    """Capped exponential delay with up to 50% jitter to de-synchronize retries."""
+    delay = _OPERATORS_RETRY_BASE * (2 ** (attempt - 1)) * (1 + random.uniform(0, 0.5))
+    return min(delay, _OPERATORS_RETRY_CAP)
+
+
+async def _run_bounded_in_namespace(
+    namespace: str, job_fn: Callable[..., Awaitable[None]], *args: Any
+) -> None:
+    """Run a job once no other job holds the namespace, then a job slot is free.
+
+    Jobs for the same namespace queue up on the namespace lock rather than
+    each spawning the CLI only to hit "another operation in progress". The
+    lock is taken before the job slot, so queued jobs don't hold slots that
+    other jobs could use.
+    """
+    async with _namespace_lock(namespace):
+        await _run_bounded(job_fn, *args)
+
+
 async def _update_namespace_operators_job(job_id: str, req: NamespaceOperatorsUpdate) -> None:
     await jobs.update(job_id, status="running", started_at=utcnow_iso())
     logger.info(
@@ -894,10 +1076,10 @@ async def _update_namespace_operators_job(job_id: str, req: NamespaceOperatorsUp
     )
 
     steps: list[Dict[str, Any]] = []
+    step_log = StepLog(job_id)
     overall_status = "succeeded"
     summary_text = f"Operators updated for namespace {req.namespace}"
-    conflict_backoff = 20
-    max_attempts = 3
+    max_attempts = _OPERATORS_RETRY_ATTEMPTS
     attempt = 0
     last_failure_message: Optional[str] = None
 
@@ -907,7 +1089,7 @@ async def _update_namespace_operators_job(job_id: str, req: NamespaceOperatorsUp
             outcome = await _update_namespace_operators_once(req)
             outcome.result["attempt"] = attempt
             steps.append(outcome.result)
-            _log_job_step(job_id, outcome.result)
+            step_log.add(outcome.result)
 
             if outcome.succeeded:
                 break
@@ -915,7 +1097,8 @@ async def _update_namespace_operators_job(job_id: str, req: NamespaceOperatorsUp
             if outcome.meta.get("transient_conflict"):
                 last_failure_message = outcome.meta.get("failure_message")
                 if attempt < max_attempts:
-                    await asyncio.sleep(conflict_backoff)
+                    # No sleep after the final attempt; it fails right away
+                    await asyncio.sleep(_conflict_backoff(attempt))
                     continue
                 overall_status = "failed"
                 summary_text = (
@@ -944,7 +1127,7 @@ async def _update_namespace_operators_job(job_id: str, req: NamespaceOperatorsUp
             "stderr": str(exc),
         }
         steps.append(step)
-        _log_job_step(job_id, step)
+        step_log.add(step)
         logger.exception(
             "Namespace operators job failed",
             extra={"event": "job_failed", "job_id": job_id},
@@ -972,6 +1155,7 @@ async def _update_namespace_operators_job(job_id: str, req: NamespaceOperatorsUp
             summary=summary_text,
             result=result_payload,
         )
+        step_log.flush()
         logger.info(
             "job finished",
             extra={
@@ -983,6 +1167,18 @@ async def _update_namespace_operators_job(job_id: str, req: NamespaceOperatorsUp
         )
 
 
+_ACCOUNT_VERBS = ("deactivate", "disable", "suspend", "lock")
+# Verb that last deactivated an account, per everestctl binary (resolved path);
+# tried first next time
+_last_good_deactivate: Dict[str, str] = {}
+# CLI rejected the verb itself (not supported by this everestctl version)
+_UNKNOWN_COMMAND_RE = re.compile(r"unknown command|unrecognized|no such command", re.IGNORECASE)
+# kubectl scale failures that just mean the namespace has no StatefulSets
+_NOTHING_TO_SCALE_RE = re.compile(
+    r'no objects passed to scale|no matches for kind "statefulset"', re.IGNORECASE
+)
+
+
 async def _suspend_user_job(job_id: str, req: SuspendUserRequest) -> None:
     ns = req.namespace or req.username
     await jobs.update(job_id, status="running", started_at=utcnow_iso())
@@ -992,58 +1188,42 @@ async def _suspend_user_job(job_id: str, req: SuspendUserRequest) -> None:
     )
 
     steps: list[Dict[str, Any]] = []
+    step_log = StepLog(job_id)
     overall_status = "succeeded"
     summary_bits: list[str] = []
     scale_success = False
     rbac_success = False
 
     try:
-        help_step: Dict[str, Any]
-        try:
-            help_res = await run_cmd(["everestctl", "accounts", "--help"], timeout=10)
-            help_text = (help_res.get("stdout", "") + "\n" + help_res.get("stderr", "")).lower()
-            help_step = {**help_res, "name": "accounts_help"}
-        except Exception as exc:  # pragma: no cover - defensive
-            help_text = ""
-            help_step = {
-                "name": "accounts_help",
-                "command": "everestctl accounts --help",
-                "exit_code": 1,
-                "stdout": "",
-                "stderr": str(exc),
-            }
-        steps.append(help_step)
-        _log_job_step(job_id, help_step)
-
-        supported = set()
-        for name in ("deactivate", "disable", "suspend", "lock"):
-            if f"\n  {name} " in help_text or f"accounts {name}" in help_text:
-                supported.add(name)
-        if supported:
-            variants = []
-            if "deactivate" in supported:
-                variants.append(["everestctl", "accounts", "deactivate", "-u", req.username])
-            if "disable" in supported:
-                variants.append(["everestctl", "accounts", "disable", "-u", req.username])
-            if "suspend" in supported:
-                variants.append(["everestctl", "accounts", "suspend", "-u", req.username])
-            if "lock" in supported:
-                variants.append(["everestctl", "accounts", "lock", "-u", req.username])
-            for variant in variants:
-                res = await run_cmd(variant, timeout=60)
-                res.update({"name": "deactivate_account", "variant": variant[2]})
-                steps.append(res)
-                _log_job_step(job_id, res)
+        async def _deactivate_account() -> list[Dict[str, Any]]:
+            out: list[Dict[str, Any]] = []
+            binary_key = _everestctl_key()
+            verbs = list(_ACCOUNT_VERBS)
+            last_good = _last_good_deactivate.get(binary_key)
+            if last_good in verbs:
+                verbs.remove(last_good)
+                verbs.insert(0, last_good)
+            # Try verbs directly instead of probing `accounts --help`. A verb
+            # this CLI doesn't know moves on to the next one (only the last
+            # such attempt is recorded); any other failure is final.
+            for idx, verb in enumerate(verbs):
+                res = await run_cmd(["everestctl", "accounts", verb, "-u", req.username], timeout=60)
+                res.update({"name": "deactivate_account", "variant": verb})
                 if res.get("exit_code") == 0:
-                    summary_bits.append("account deactivated")
+                    out.append(res)
+                    _last_good_deactivate[binary_key] = verb
                     break
+                if _output_matches(res, _UNKNOWN_COMMAND_RE) and idx < len(verbs) - 1:
+                    continue
+                out.append(res)
+                break
+            return out
 
-        if req.scale_statefulsets:
+        async def _scale_down() -> Dict[str, Any]:
             scale_cmd = build_scale_statefulsets_cmd(ns)
             scale_res = await run_cmd(scale_cmd, timeout=90)
             if scale_res.get("exit_code") != 0:
-                errtxt = (scale_res.get("stderr", "") + scale_res.get("stdout", "")).lower()
-                if "no objects passed to scale" in errtxt or "no matches for kind \"statefulset\"" in errtxt:
+                if _output_matches(scale_res, _NOTHING_TO_SCALE_RE):
                     scale_res["exit_code"] = 0
                     msg = "no StatefulSets to scale"
                     scale_res["stdout"] = (
@@ -1051,19 +1231,38 @@ async def _suspend_user_job(job_id: str, req: SuspendUserRequest) -> None:
                         + ("\n" if scale_res.get("stdout") else "")
                         + msg
                     ).strip()
-            scale_res.update({"name": "scale_down_statefulsets"})
+            scale_res["name"] = "scale_down_statefulsets"
+            return scale_res
+
+        # Deactivation, scale-down and RBAC revoke are independent of each
+        # other, so run them concurrently; steps are recorded in fixed order.
+        deactivate_steps, scale_res, rbac_res = await _gather_or_cancel(
+            _deactivate_account(),
+            _scale_down() if req.scale_statefulsets else _skipped_step(),
+            revoke_user_in_rbac_configmap(req.username, timeout=90) if req.revoke_rbac else _skipped_step(),
+        )
+
+        for step in deactivate_steps:
+            steps.append(step)
+            step_log.add(step)
+        if any(
+            step.get("name") == "deactivate_account" and step.get("exit_code") == 0
+            for step in deactivate_steps
+        ):
+            summary_bits.append("account deactivated")
+
+        if scale_res is not None:
             steps.append(scale_res)
-            _log_job_step(job_id, scale_res)
+            step_log.add(scale_res)
             scale_success = scale_res.get("exit_code") == 0
             if scale_success:
                 summary_bits.append("workloads scaled down")
         else:
             scale_success = True
 
-        if req.revoke_rbac:
-            rbac_res = await revoke_user_in_rbac_configmap(req.username, timeout=90)
+        if rbac_res is not None:
             steps.append(rbac_res)
-            _log_job_step(job_id, rbac_res)
+            step_log.add(rbac_res)
             rbac_success = rbac_res.get("exit_code") == 0
             if rbac_success:
                 summary_bits.append("RBAC revoked")
@@ -1082,11 +1281,12 @@ async def _suspend_user_job(job_id: str, req: SuspendUserRequest) -> None:
             "stderr": str(exc),
         }
         steps.append(step)
-        _log_job_step(job_id, step)
+        step_log.add(step)
         logger.exception(
             "Suspend user job failed",
             extra={"event": "job_failed", "job_id": job_id},
         )
+    _invalidate_accounts_cache()
 
     summary_text = (
         f"Suspended {req.username} in namespace {ns}" if overall_status == "succeeded" else f"Failed to suspend {req.username}"
@@ -1116,6 +1316,7 @@ async def _suspend_user_job(job_id: str, req: SuspendUserRequest) -> None:
         summary=summary_text,
         result=result_payload,
     )
+    step_log.flush()
     logger.info(
         "job finished",
         extra={
@@ -1136,6 +1337,7 @@ async def _delete_user_job(job_id: str, req: DeleteUserRequest) -> None:
     )
 
     steps: list[Dict[str, Any]] = []
+    step_log = StepLog(job_id)
     overall_status = "succeeded"
     summary_parts: list[str] = []
     namespace_removed = False
@@ -1145,7 +1347,7 @@ async def _delete_user_job(job_id: str, req: DeleteUserRequest) -> None:
         rm_ns = await run_cmd(["everestctl", "namespaces", "remove", ns], timeout=180)
         rm_ns.update({"name": "remove_namespace"})
         steps.append(rm_ns)
-        _log_job_step(job_id, rm_ns)
+        step_log.add(rm_ns)
         if rm_ns.get("exit_code") == 0:
             namespace_removed = True
         else:
@@ -1163,26 +1365,44 @@ async def _delete_user_job(job_id: str, req: DeleteUserRequest) -> None:
             )
             k8s_del.update({"name": "delete_namespace"})
             steps.append(k8s_del)
-            _log_job_step(job_id, k8s_del)
+            step_log.add(k8s_del)
             namespace_removed = k8s_del.get("exit_code") == 0
 
         rbac_res = await revoke_user_in_rbac_configmap(req.username, timeout=90)
         steps.append(rbac_res)
-        _log_job_step(job_id, rbac_res)
+        step_log.add(rbac_res)
 
         if req.delete_account:
-            del_cmds = [
-                ["everestctl", "accounts", "delete", "-u", req.username],
-                ["everestctl", "accounts", "remove", "-u", req.username],
-            ]
-            for cmd in del_cmds:
-                res = await run_cmd(cmd, timeout=60)
-                res.update({"name": "delete_account"})
-                steps.append(res)
-                _log_job_step(job_id, res)
-                if res.get("exit_code") == 0:
-                    account_deleted = True
-                    break
+            # Only one of these verbs exists for a given everestctl version and
+            # account deletion is idempotent, so race both and keep the first
+            # success; the other attempt is cancelled.
+            del_verbs = ("delete", "remove")
+            tasks = {
+                asyncio.create_task(
+                    run_cmd(["everestctl", "accounts", verb, "-u", req.username], timeout=60)
+                ): verb
+                for verb in del_verbs
+            }
+            results: Dict[str, Dict[str, Any]] = {}
+            pending = set(tasks)
+            try:
+                while pending and not account_deleted:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        res = task.result()
+                        res.update({"name": "delete_account", "variant": tasks[task]})
+                        results[tasks[task]] = res
+                        if res.get("exit_code") == 0:
+                            account_deleted = True
+            finally:
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    await asyncio.gather(*pending, return_exceptions=True)
+            for verb in del_verbs:
+                if verb in results:
+                    steps.append(results[verb])
+                    step_log.add(results[verb])
 
         if namespace_removed:
             summary_parts.append(f"namespace {ns} removed")
@@ -1200,11 +1420,12 @@ async def _delete_user_job(job_id: str, req: DeleteUserRequest) -> None:
             "stderr": str(exc),
         }
         steps.append(step)
-        _log_job_step(job_id, step)
+        step_log.add(step)
         logger.exception(
             "Delete user job failed",
             extra={"event": "job_failed", "job_id": job_id},
         )
+    _invalidate_accounts_cache()
 
     summary_text = (
         f"Deleted user {req.username} resources" if overall_status == "succeeded" else f"Failed to delete user {req.username}"
@@ -1233,6 +1454,7 @@ async def _delete_user_job(job_id: str, req: DeleteUserRequest) -> None:
         summary=summary_text,
         result=result_payload,
     )
+    step_log.flush()
     logger.info(
         "job finished",
         extra={
@@ -1247,57 +1469,63 @@ async def _delete_user_job(job_id: str, req: DeleteUserRequest) -> None:
 @app.post(
     "/accounts/password",
     status_code=status.HTTP_202_ACCEPTED,
-    dependencies=[Depends(require_admin_key)],
+    response_model=None,
+    dependencies=_ADMIN_DEPS,
 )
-async def set_account_password(req: PasswordChangeRequest, background: BackgroundTasks):
+async def set_account_password(req: PasswordChangeRequest, background: BackgroundTasks) -> Response:
     job = await jobs.create()
     logger.info(
         "job created",
         extra={"event": "job_created", "job_id": job.job_id, "username": req.username},
     )
 
-    background.add_task(_set_account_password_job, job.job_id, req)
-    return {"job_id": job.job_id, "status_url": f"/jobs/{job.job_id}"}
+    background.add_task(_run_bounded, _set_account_password_job, job.job_id, req)
+    return _job_accepted(job.job_id)
 
 
 @app.post(
     "/namespaces/resources",
     status_code=status.HTTP_202_ACCEPTED,
-    dependencies=[Depends(require_admin_key)],
+    response_model=None,
+    dependencies=_ADMIN_DEPS,
 )
-async def update_namespace_resources(req: NamespaceResourceUpdate, background: BackgroundTasks):
+async def update_namespace_resources(req: NamespaceResourceUpdate, background: BackgroundTasks) -> Response:
     job = await jobs.create()
     logger.info(
         "job created",
         extra={"event": "job_created", "job_id": job.job_id, "namespace": req.namespace},
     )
 
-    background.add_task(_update_namespace_resources_job, job.job_id, req)
-    return {"job_id": job.job_id, "status_url": f"/jobs/{job.job_id}"}
+    background.add_task(_run_bounded, _update_namespace_resources_job, job.job_id, req)
+    return _job_accepted(job.job_id)
 
 
 @app.post(
     "/namespaces/operators",
     status_code=status.HTTP_202_ACCEPTED,
-    dependencies=[Depends(require_admin_key)],
+    response_model=None,
+    dependencies=_ADMIN_DEPS,
 )
-async def update_namespace_operators(req: NamespaceOperatorsUpdate, background: BackgroundTasks):
+async def update_namespace_operators(req: NamespaceOperatorsUpdate, background: BackgroundTasks) -> Response:
     job = await jobs.create()
     logger.info(
         "job created",
         extra={"event": "job_created", "job_id": job.job_id, "namespace": req.namespace},
     )
 
-    background.add_task(_update_namespace_operators_job, job.job_id, req)
-    return {"job_id": job.job_id, "status_url": f"/jobs/{job.job_id}"}
+    background.add_task(
+        _run_bounded_in_namespace, req.namespace, _update_namespace_operators_job, job.job_id, req
+    )
+    return _job_accepted(job.job_id)
 
 
 @app.post(
     "/accounts/suspend",
     status_code=status.HTTP_202_ACCEPTED,
-    dependencies=[Depends(require_admin_key)],
+    response_model=None,
+    dependencies=_ADMIN_DEPS,
 )
-async def suspend_user(req: SuspendUserRequest, background: BackgroundTasks):
+async def suspend_user(req: SuspendUserRequest, background: BackgroundTasks) -> Response:
     job = await jobs.create()
     ns = req.namespace or req.username
     logger.info(
@@ -1310,16 +1538,17 @@ async def suspend_user(req: SuspendUserRequest, background: BackgroundTasks):
         },
     )
 
-    background.add_task(_suspend_user_job, job.job_id, req)
-    return {"job_id": job.job_id, "status_url": f"/jobs/{job.job_id}"}
+    background.add_task(_run_bounded, _suspend_user_job, job.job_id, req)
+    return _job_accepted(job.job_id)
 
 
 @app.post(
     "/accounts/delete",
     status_code=status.HTTP_202_ACCEPTED,
-    dependencies=[Depends(require_admin_key)],
+    response_model=None,
+    dependencies=_ADMIN_DEPS,
 )
-async def delete_user(req: DeleteUserRequest, background: BackgroundTasks):
+async def delete_user(req: DeleteUserRequest, background: BackgroundTasks) -> Response:
     job = await jobs.create()
     ns = req.namespace or req.username
     logger.info(
@@ -1332,16 +1561,39 @@ async def delete_user(req: DeleteUserRequest, background: BackgroundTasks):
         },
     )
 
-    background.add_task(_delete_user_job, job.job_id, req)
-    return {"job_id": job.job_id, "status_url": f"/jobs/{job.job_id}"}
+    background.add_task(_run_bounded, _delete_user_job, job.job_id, req)
+    return _job_accepted(job.job_id)
+
+
+try:
+    from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+except Exception:  # pragma: no cover - metrics are optional
+    CONTENT_TYPE_LATEST = None  # type: ignore
+    generate_latest = None  # type: ignore
+
+# Rendered /metrics snapshot: [monotonic ts, raw bytes, gzip bytes or None]
+_METRICS_CACHE_TTL = 1.0
+_metrics_snapshot: Optional[list] = None
 
 
 @app.get("/metrics")
-async def metrics() -> Response:
-    """Prometheus metrics exposition."""
-    try:
-        from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
-    except Exception:
+async def metrics(accept_encoding: Optional[str] = Header(None, alias="Accept-Encoding")) -> Response:
+    """Prometheus metrics exposition, re-rendered at most once per second."""
+    global _metrics_snapshot
+    if generate_latest is None:
         raise HTTPException(status_code=503, detail="prometheus_client not installed")
-    data = generate_latest()  # type: ignore
-    return Response(content=data, media_type=CONTENT_TYPE_LATEST)
+    now = time.monotonic()
+    snap = _metrics_snapshot
+    if snap is None or now - snap[0] >= _METRICS_CACHE_TTL:
+        snap = [now, generate_latest(), None]  # type: ignore
+        _metrics_snapshot = snap
+    if accept_encoding and "gzip" in accept_encoding.lower():
+        if snap[2] is None:
+            # Compress lazily, once per snapshot
+            snap[2] = gzip.compress(snap[1], compresslevel=1)
+        return Response(
+            content=snap[2],
+            media_type=CONTENT_TYPE_LATEST,
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+    return Response(content=snap[1], media_type=CONTENT_TYPE_LATEST, headers={"Vary": "Accept-Encoding"})
@@ -1,8 +1,12 @@
 import asyncio
+import functools
 import os
 import re
+import shutil
+import signal
 import time
-from typing import Optional, Sequence, Dict, Any
+from contextvars import ContextVar, Token
+from typing import Optional, Sequence, Dict, Any, Tuple
 
 try:
     from prometheus_client import Counter, Histogram
@@ -34,23 +38,152 @@ else:  # pragma: no cover - metrics optional
     CLI_LATENCY = None  # type: ignore
 
 
+@functools.lru_cache(maxsize=256)
+def _cli_calls_child(tool: str, exit_code: str):
+    # Pre-bound label children: skips the labels() lookup/validation per call
+    return CLI_CALLS.labels(tool=tool, exit_code=exit_code)
+
+
+@functools.lru_cache(maxsize=64)
+def _cli_latency_child(tool: str):
+    return CLI_LATENCY.labels(tool=tool)
+
+
+@functools.lru_cache(maxsize=64)
+def resolve_executable(name: str) -> str:
+    """Return the path run_cli executes for `name` (one PATH search per name).
+
+    Unresolved names are passed through so exec still reports 127 normally.
+    """
+    if os.sep in name:
+        return name
+    return shutil.which(name) or name
+
+
+# Upper bound on waiting for a killed child. Before Python 3.12,
+# Process.wait() also waits for the stdio pipes to close, which a
+# backgrounded grandchild that inherited them can hold open indefinitely;
+# the child watcher reaps the pid itself either way.
+_KILL_WAIT_SECONDS = 5.0
+
+
+async def _kill_and_reap(proc: asyncio.subprocess.Process) -> None:
+    # CLIs run in their own session, so this also takes down any grandchild
+    # still holding the stdio pipes
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass
+    try:
+        await asyncio.wait_for(proc.wait(), _KILL_WAIT_SECONDS)
+    except asyncio.TimeoutError:
+        pass
+
+
 def _strip_ansi(s: str) -> str:
     return ANSI_ESCAPE.sub("", s)
 
 
-def _truncate(s: str, limit: int = 8000) -> str:
-    if len(s) <= limit:
+def _truncate(s: str, limit: int = 8000, dropped: int = 0) -> str:
+    # dropped: bytes already discarded from the middle while reading
+    if len(s) <= limit and not dropped:
         return s
-    head = s[: limit // 2]
-    tail = s[-limit // 2 :]
-    return f"{head}\n...<truncated {len(s) - limit} bytes>...\n{tail}"
+    keep = min(limit // 2, len(s) // 2)
+    head = s[:keep]
+    tail = s[len(s) - keep :]
+    return f"{head}\n...<truncated {len(s) - 2 * keep + dropped} bytes>...\n{tail}"
+
+
+# Raw bytes kept from each end of a stream while reading; the middle of very
+# verbose output is discarded as it arrives instead of buffered in full.
+_READ_KEEP_BYTES = 16384
+_READ_CHUNK = 65536
+
+
+async def _read_capped(stream: Optional[asyncio.StreamReader]) -> Tuple[str, int]:
+    """Drain a pipe keeping its head and tail; return (decoded text, dropped bytes)."""
+    if stream is None:
+        return "", 0
+    head = bytearray()
+    tail = bytearray()
+    total = 0
+    while True:
+        chunk = await stream.read(_READ_CHUNK)
+        if not chunk:
+            break
+        total += len(chunk)
+        if len(head) < _READ_KEEP_BYTES:
+            take = _READ_KEEP_BYTES - len(head)
+            head += chunk[:take]
+            chunk = chunk[take:]
+        if chunk:
+            tail += chunk
+            if len(tail) > 2 * _READ_KEEP_BYTES:
+                del tail[:-_READ_KEEP_BYTES]
+    if len(tail) > _READ_KEEP_BYTES:
+        del tail[:-_READ_KEEP_BYTES]
+    dropped = total - len(head) - len(tail)
+    # Decode the ends separately so a cut multibyte char only garbles one edge
+    text = head.decode(errors="replace") + tail.decode(errors="replace")
+    return text, dropped
+
+
+async def _feed_stdin(stream: Optional[asyncio.StreamWriter], data: Optional[bytes]) -> None:
+    if stream is None:
+        return
+    try:
+        if data:
+            stream.write(data)
+            await stream.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        pass  # child exited without reading its input
+    finally:
+        stream.close()
+
+
+# Loop-time deadline of the job running in the current task context (if any).
+# Tasks spawned by a job inherit it, so every CLI call in the job is bounded.
+_job_deadline: ContextVar[Optional[float]] = ContextVar("job_deadline", default=None)
+
+
+def set_job_deadline(seconds: float) -> Token:
+    """Bound all later run_cmd calls in this task context to `seconds` from now.
+
+    Returns the token to pass to reset_job_deadline once the job is done.
+    """
+    return _job_deadline.set(asyncio.get_running_loop().time() + seconds)
+
+
+def reset_job_deadline(token: Token) -> None:
+    _job_deadline.reset(token)
+
+
+def _job_step_timeout(timeout: float) -> Optional[float]:
+    """Clamp a step timeout to the current job's remaining time.
+
+    None means less than a second is left and the command should not start.
+    """
+    deadline = _job_deadline.get()
+    if deadline is None:
+        return timeout
+    remaining = deadline - asyncio.get_running_loop().time()
+    if remaining < 1:
+        return None
+    return min(timeout, remaining)
+
+
+class _DeadlineExceeded(Exception):
+    """Raised inside run_cli when the job deadline leaves no time to start."""
 
 
 async def run_cli(
     cmd: Sequence[str],
     *,
     input_text: Optional[str] = None,
-    timeout: int = 60,
+    timeout: float = 60,
     env: Optional[Dict[str, str]] = None,
     retries: int = 0,
     backoff_seconds: float = 0.5,
@@ -76,7 +209,7 @@ async def run_cli(
             proc_env.update(env)
 
     # Identify tool for metrics label
-    tool = cmd[0] if cmd else ""
+    tool = (cmd[0] if cmd else "") or "unknown"
 
     attempt = 0
     last_result: Dict[str, Any] = {
@@ -89,40 +222,73 @@ async def run_cli(
     while True:
         attempt += 1
         start = time.perf_counter()
+        cancelled = False
+        not_started = False
         try:
             async with _SUBPROC_SEM:
+                # Clamp only now: time spent waiting for a slot counts too
+                step_timeout = _job_step_timeout(timeout)
+                if step_timeout is None:
+                    raise _DeadlineExceeded
                 proc = await asyncio.create_subprocess_exec(
-                    *cmd,
+                    resolve_executable(cmd[0]),
+                    *cmd[1:],
                     stdin=asyncio.subprocess.PIPE if input_text is not None else None,
                     stdout=asyncio.subprocess.PIPE,
                     stderr=asyncio.subprocess.PIPE,
                     env=proc_env,
+                    start_new_session=True,
                 )
-                try:
-                    stdout_b, stderr_b = await asyncio.wait_for(
-                        proc.communicate(input_text.encode() if input_text is not None else None),
-                        timeout=timeout,
+                async def _collect() -> Tuple[Tuple[str, int], Tuple[str, int]]:
+                    out, err, _ = await asyncio.gather(
+                        _read_capped(proc.stdout),
+                        _read_capped(proc.stderr),
+                        _feed_stdin(proc.stdin, input_text.encode() if input_text is not None else None),
                     )
+                    await proc.wait()
+                    return out, err
+
+                try:
+                    captured = await asyncio.wait_for(_collect(), timeout=step_timeout)
                 except asyncio.TimeoutError:
-                    try:
-                        proc.kill()
-                    finally:
-                        pass
-                    last_result = {
-                        "command": " ".join(cmd),
-                        "exit_code": 124,
-                        "stdout": "",
-                        "stderr": f"Command timed out after {timeout}s",
-                    }
-                    continue  # fall through to retry/metrics logic
-
-            stdout = _truncate(_strip_ansi(stdout_b.decode(errors="replace")))
-            stderr = _truncate(_strip_ansi(stderr_b.decode(errors="replace")))
+                    # Kill and reap only; do not drain the pipes of a hung CLI
+                    # just to throw the buffered output away.
+                    await _kill_and_reap(proc)
+                    captured = None
+                except asyncio.CancelledError:
+                    # Caller gave up on this command (e.g. lost a race); don't
+                    # leave the child running unobserved. Shielded so a second
+                    # cancel can't skip reaping it.
+                    await asyncio.shield(_kill_and_reap(proc))
+                    raise
+
+            if captured is None:
+                last_result = {
+                    "command": " ".join(cmd),
+                    "exit_code": 124,
+                    "stdout": "",
+                    "stderr": f"Command timed out after {step_timeout:g}s",
+                }
+            else:
+                (out_text, out_dropped), (err_text, err_dropped) = captured
+                stdout = _truncate(_strip_ansi(out_text), dropped=out_dropped)
+                stderr = _truncate(_strip_ansi(err_text), dropped=err_dropped)
+                last_result = {
+                    "command": " ".join(cmd),
+                    "exit_code": proc.returncode,
+                    "stdout": stdout,
+                    "stderr": stderr,
+                }
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        except _DeadlineExceeded:
+            not_started = True
             last_result = {
                 "command": " ".join(cmd),
-                "exit_code": proc.returncode,
-                "stdout": stdout,
-                "stderr": stderr,
+                "exit_code": 124,
+                "stdout": "",
+                "stderr": "Job deadline exceeded; command not started",
             }
         except FileNotFoundError as e:
             last_result = {
@@ -139,14 +305,17 @@ async def run_cli(
                 "stderr": f"Unhandled error: {e}",
             }
         finally:
-            if CLI_LATENCY:
+            # A cancelled call is no CLI outcome: own label, no latency sample.
+            # A call the deadline kept from starting is not counted at all.
+            if CLI_LATENCY and not (cancelled or not_started):
                 try:
-                    CLI_LATENCY.labels(tool=tool or "unknown").observe(max(0.0, time.perf_counter() - start))
+                    _cli_latency_child(tool).observe(max(0.0, time.perf_counter() - start))
                 except Exception:
                     pass
-            if CLI_CALLS:
+            if CLI_CALLS and not not_started:
                 try:
-                    CLI_CALLS.labels(tool=tool or "unknown", exit_code=str(last_result.get("exit_code"))).inc()
+                    label = "cancelled" if cancelled else str(last_result.get("exit_code"))
+                    _cli_calls_child(tool, label).inc()
                 except Exception:
                     pass
 
@@ -160,9 +329,13 @@ async def run_cmd(
     cmd: Sequence[str],
     *,
     input_text: Optional[str] = None,
-    timeout: int = 60,
+    timeout: float = 60,
     env: Optional[Dict[str, str]] = None,
 ) -> Dict[str, Any]:
-    """Backwards-compatible wrapper used throughout the app."""
-    return await run_cli(cmd, input_text=input_text, timeout=timeout, env=env)
+    """Backwards-compatible wrapper used throughout the app.
 
+    Inside a job, run_cli clamps the per-step timeout to the job's remaining
+    time once it has a subprocess slot; with less than a second left the
+    command is not started.
+    """
+    return await run_cli(cmd, input_text=input_text, timeout=timeout, env=env)
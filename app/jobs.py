@@ -1,9 +1,11 @@
 import asyncio
 import uuid
-from dataclasses import dataclass, field, asdict
+from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
+from .json_utils import dumps_bytes
+
 
 def utcnow_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -19,10 +21,33 @@ class Job:
     result: Dict[str, Any] = field(default_factory=dict)
 
 
+# Statuses after which a job no longer changes
+_TERMINAL_STATUSES = frozenset({"succeeded", "failed"})
+
+
+@dataclass(frozen=True, slots=True)
+class EncodedJob:
+    """JSON status body of a finished job, encoded once when it finishes.
+
+    The result is encoded once and embedded in the status body; the result
+    body is the [result_start:result_end] slice of it.
+    """
+
+    status: bytes
+    result_start: int
+    result_end: int
+
+    @property
+    def result(self) -> bytes:
+        return self.status[self.result_start:self.result_end]
+
+
 class JobStore:
     def __init__(self) -> None:
         self._jobs: Dict[str, Job] = {}
         self._lock = asyncio.Lock()
+        # Only finished jobs are cached; running jobs are encoded per request
+        self._encoded: Dict[str, EncodedJob] = {}
 
     async def create(self) -> Job:
         job_id = str(uuid.uuid4())
@@ -42,15 +67,46 @@ class JobStore:
                 return None
             for k, v in updates.items():
                 setattr(job, k, v)
+            if job.status in _TERMINAL_STATUSES:
+                self._encoded[job_id] = self._encode_finished(job)
+            else:
+                self._encoded.pop(job_id, None)
             return job
 
     async def serialize(self, job_id: str) -> Optional[Dict[str, Any]]:
         job = await self.get(job_id)
         if not job:
             return None
+        return self._payload(job)
+
+    @staticmethod
+    def _payload(job: Job) -> Dict[str, Any]:
         data = asdict(job)
         # Provide a result URL for convenience
         data["job_id"] = job.job_id
         data["result_url"] = f"/jobs/{job.job_id}/result"
         return data
 
+    @classmethod
+    def _encode_finished(cls, job: Job) -> EncodedJob:
+        # Encode everything but the result, then splice the result in once
+        data = {f.name: getattr(job, f.name) for f in fields(job) if f.name != "result"}
+        data["result_url"] = f"/jobs/{job.job_id}/result"
+        head = dumps_bytes(data)[:-1] + b',"result":'
+        status = head + dumps_bytes(job.result) + b"}"
+        return EncodedJob(status=status, result_start=len(head), result_end=len(status) - 1)
+
+    async def serialize_json(self, job_id: str) -> Optional[bytes]:
+        """serialize() encoded as JSON; finished jobs reuse their cached body."""
+        encoded = self._encoded.get(job_id)
+        if encoded is not None:
+            return encoded.status
+        data = await self.serialize(job_id)
+        return None if data is None else dumps_bytes(data)
+
+    def result_json(self, job: Job) -> bytes:
+        """The job's result encoded as JSON; cached once the job has finished."""
+        encoded = self._encoded.get(job.job_id)
+        if encoded is not None:
+            return encoded.result
+        return dumps_bytes(job.result)
@@ -0,0 +1,48 @@
+import json
+from typing import Any, Callable, Optional
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore
+
+# Compact stdlib encoders used when orjson is not installed
+_std_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+_std_encode_lenient = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=str).encode
+
+
+def dumps_bytes(obj: Any, *, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=default)
+    if default is str:
+        return _std_encode_lenient(obj).encode()
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=default).encode()
+
+
+def dumps(obj: Any, *, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serialize to a compact JSON string (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=default).decode()
+    if default is None:
+        return _std_encode(obj)
+    if default is str:
+        return _std_encode_lenient(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=default)
+
+
+def loads(data: Any) -> Any:
+    """Parse JSON from str/bytes. Raises json.JSONDecodeError on bad input."""
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when installed, stdlib otherwise."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps_bytes(content)
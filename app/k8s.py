@@ -1,5 +1,6 @@
 import os
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
 
 def build_quota_limitrange_yaml(namespace: str, resources: Dict[str, Any]) -> str:
@@ -12,11 +13,31 @@ def build_quota_limitrange_yaml(namespace: str, resources: Dict[str, Any]) -> st
     ram_mb = int(resources.get("ram_mb", 2048))
     disk_gb = int(resources.get("disk_gb", 20))
     max_dbs = resources.get("max_databases")
+    max_dbs_int: Optional[int] = None
+    if max_dbs is not None:
+        try:
+            max_dbs_int = int(max_dbs)
+        except Exception:
+            max_dbs_int = None
 
     # Parse optional DB count resources to enforce via ResourceQuota count/<resource>
     # Comma-separated list, e.g.:
     #   perconaservermongodbs.psmdb.percona.com,perconapgclusters.pgv2.percona.com,perconaxtradbclusters.pxc.percona.com
     count_resources_env = os.environ.get("EVEREST_DB_COUNT_RESOURCES", "").strip()
+
+    return _render_quota_limitrange(namespace, cpu, ram_mb, disk_gb, max_dbs_int, count_resources_env)
+
+
+@lru_cache(maxsize=256)
+def _render_quota_limitrange(
+    namespace: str,
+    cpu: int,
+    ram_mb: int,
+    disk_gb: int,
+    max_dbs_int: Optional[int],
+    count_resources_env: str,
+) -> str:
+    """Render the manifest; memoized since re-applies repeat the same inputs."""
     count_resources: List[str] = [r.strip() for r in count_resources_env.split(",") if r.strip()]
 
     # Simple defaults for LimitRange (per container)
@@ -42,16 +63,11 @@ spec:
 """.strip()
 
     # Append count quotas if configured
-    if max_dbs is not None and count_resources:
-        try:
-            max_dbs_int = int(max_dbs)
-        except Exception:
-            max_dbs_int = None
-        if max_dbs_int is not None and max_dbs_int >= 0:
-            count_lines = []
-            for res in count_resources:
-                count_lines.append(f"    count/{res}: \"{max_dbs_int}\"")
-            quota_yaml = quota_yaml + "\n" + "\n".join(count_lines)
+    if max_dbs_int is not None and max_dbs_int >= 0 and count_resources:
+        count_lines = []
+        for res in count_resources:
+            count_lines.append(f"    count/{res}: \"{max_dbs_int}\"")
+        quota_yaml = quota_yaml + "\n" + "\n".join(count_lines)
 
     limitrange_yaml = f"""
 apiVersion: v1
@@ -1,16 +1,51 @@
-import json
+import atexit
+import copy
 import logging
+import logging.handlers
+import queue
 import sys
 import time
 import uuid
 from contextvars import ContextVar
 from typing import Any, Dict, Optional
 
+from .json_utils import dumps
+
 
 # Context var to store request id per coroutine
 request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
 
 
+def _encode(payload: Dict[str, Any]) -> str:
+    # Compact, orjson-backed when available; str() anything not serializable
+    return dumps(payload, default=str)
+
+
+# Extra LogRecord attributes copied into the JSON payload when present
+_EXTRA_KEYS = (
+    "event",
+    "path",
+    "method",
+    "status_code",
+    "duration_ms",
+    "client",
+    # Job-related extras
+    "job_id",
+    "status",
+    "step_name",
+    "command",
+    "exit_code",
+    "stdout",
+    "stderr",
+    "stdout_preview",
+    "stderr_preview",
+    "steps",
+    "summary",
+    "username",
+    "namespace",
+)
+
+
 def get_request_id() -> Optional[str]:
     return request_id_var.get()
 
@@ -39,36 +74,53 @@ class JSONFormatter(logging.Formatter):
         if rid:
             payload["request_id"] = rid
         # Attach any custom extras (flat)
-        for key in (
-            "event",
-            "path",
-            "method",
-            "status_code",
-            "duration_ms",
-            "client",
-            # Job-related extras
-            "job_id",
-            "status",
-            "step_name",
-            "command",
-            "exit_code",
-            "stdout",
-            "stderr",
-            "summary",
-            "username",
-            "namespace",
-        ):
+        for key in _EXTRA_KEYS:
             val = getattr(record, key, None)
             if val is not None:
                 payload[key] = val
-        return json.dumps(payload, ensure_ascii=False)
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return _encode(payload)
+
+
+class _PassthroughQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves all formatting to the listener thread.
+
+    The stock prepare() formats the record on the emitting thread (the event
+    loop) with the default Formatter, folding any traceback into the
+    message. Only the %-args are merged here; exc_info travels with the
+    record for JSONFormatter.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:  # type: ignore[override]
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# Background listener that formats and writes records (see configure_logging)
+_listener: Optional[logging.handlers.QueueListener] = None
 
 
 def configure_logging(level: int = logging.INFO) -> None:
-    """Configure root and uvicorn loggers for JSON output with correlation id."""
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(JSONFormatter())
+    """Configure root and uvicorn loggers for JSON output with correlation id.
+
+    Records are handed to a QueueHandler; JSON formatting and the stdout
+    write happen on a QueueListener thread, off the event loop.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JSONFormatter())
+
+    handler = _PassthroughQueueHandler(queue.SimpleQueue())
+    # Filters run in the emitting thread, where the request id contextvar is set
     handler.addFilter(ContextFilter())
+    _listener = logging.handlers.QueueListener(handler.queue, stream_handler)
+    _listener.start()
 
     root = logging.getLogger()
     # Clear existing handlers to avoid duplicate logs
@@ -86,10 +138,27 @@ def configure_logging(level: int = logging.INFO) -> None:
         lg.setLevel(level)
 
 
+def _stop_listener() -> None:
+    # Drain queued records on interpreter exit
+    if _listener is not None:
+        _listener.stop()
+
+
+atexit.register(_stop_listener)
+
+
+# Probe endpoints: still echo X-Request-ID, but skip the access log
+_UNLOGGED_PATHS = frozenset({"/healthz", "/readyz"})
+
+
 async def correlation_middleware(request, call_next):
     """FastAPI middleware: assign request id, log access in JSON."""
     incoming = request.headers.get("X-Request-ID")
     rid = incoming or uuid.uuid4().hex
+    if request.url.path in _UNLOGGED_PATHS:
+        response = await call_next(request)
+        response.headers.setdefault("X-Request-ID", rid)
+        return response
     token = request_id_var.set(rid)
     start = time.perf_counter()
     response = None
@@ -2,8 +2,15 @@ import json
 import re
 from typing import Any, Dict, List
 
+from .json_utils import loads
+
 # Precompiled splitter for whitespace-separated tables (performance/readability)
 _WHITESPACE_SPLITTER = re.compile(r"\s{2,}")
+_split_columns = _WHITESPACE_SPLITTER.split
+
+
+def _normalize_headers(cells: List[str]) -> List[str]:
+    return [h.strip().lower().replace(" ", "_") for h in cells if h.strip()]
 
 
 def parse_accounts_output(text: str) -> Dict[str, Any]:
@@ -17,7 +24,7 @@ def parse_accounts_output(text: str) -> Dict[str, Any]:
         return {"data": []}
     # Try JSON
     try:
-        data = json.loads(text)
+        data = loads(text)
         return {"data": data}
     except json.JSONDecodeError:
         pass
@@ -29,26 +36,26 @@ def parse_accounts_output(text: str) -> Dict[str, Any]:
 
     # Detect header splitters
     if "|" in lines[0]:
-        headers = [h.strip().lower().replace(" ", "_") for h in lines[0].split("|") if h.strip()]
+        headers = _normalize_headers(lines[0].split("|"))
+        width = len(headers)
         rows = []
         for ln in lines[1:]:
             parts = [p.strip() for p in ln.split("|") if p.strip()]
-            if len(parts) != len(headers):
+            if len(parts) != width:
                 continue
-            rows.append({headers[i]: parts[i] for i in range(len(headers))})
+            rows.append(dict(zip(headers, parts)))
         return {"data": rows}
 
     # Fallback: whitespace columns. Use multiple spaces as separator.
-    headers = [
-        h.strip().lower().replace(" ", "_") for h in _WHITESPACE_SPLITTER.split(lines[0]) if h.strip()
-    ]
+    headers = _normalize_headers(_split_columns(lines[0]))
+    width = len(headers)
     rows: List[Dict[str, Any]] = []
     for ln in lines[1:]:
-        parts = [p.strip() for p in _WHITESPACE_SPLITTER.split(ln) if p.strip()]
-        if len(parts) != len(headers):
+        parts = [p.strip() for p in _split_columns(ln) if p.strip()]
+        if len(parts) != width:
             # try single spaces split as last resort
             parts = ln.split()
-            if len(parts) != len(headers):
+            if len(parts) != width:
                 continue
-        rows.append({headers[i]: parts[i] for i in range(len(headers))})
+        rows.append(dict(zip(headers, parts)))
     return {"data": rows}
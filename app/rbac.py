@@ -5,22 +5,26 @@ import tempfile
 from typing import Any, Dict, Optional
 
 from .execs import run_cmd
+from .json_utils import loads
+
+
+# Static per-user policy template; only the user and namespace vary
+_POLICY_TEMPLATE = (
+    "p, role:{username}, namespaces, *, {namespace}\n"
+    # engines must be readable across all to enable DB creation
+    "p, role:{username}, database-engines, read, */*\n"
+    "p, role:{username}, database-clusters, *, {namespace}/*\n"
+    "p, role:{username}, database-cluster-backups, *, {namespace}/*\n"
+    "p, role:{username}, database-cluster-restores, *, {namespace}/*\n"
+    "p, role:{username}, database-cluster-credentials, read, {namespace}/*\n"
+    "p, role:{username}, backup-storages, *, {namespace}/*\n"
+    "p, role:{username}, monitoring-instances, *, {namespace}/*\n"
+    "g, {username}, role:{username}\n"
+)
 
 
 def build_policy_csv(username: str, namespace: str) -> str:
-    lines = [
-        f"p, role:{username}, namespaces, *, {namespace}",
-        # engines must be readable across all to enable DB creation
-        f"p, role:{username}, database-engines, read, */*",
-        f"p, role:{username}, database-clusters, *, {namespace}/*",
-        f"p, role:{username}, database-cluster-backups, *, {namespace}/*",
-        f"p, role:{username}, database-cluster-restores, *, {namespace}/*",
-        f"p, role:{username}, database-cluster-credentials, read, {namespace}/*",
-        f"p, role:{username}, backup-storages, *, {namespace}/*",
-        f"p, role:{username}, monitoring-instances, *, {namespace}/*",
-        f"g, {username}, role:{username}",
-    ]
-    return "\n".join(lines) + "\n"
+    return _POLICY_TEMPLATE.format(username=username, namespace=namespace)
 
 
 def _prune_user_policy(existing_policy: str, username: str) -> str:
@@ -47,8 +51,17 @@ def _ensure_admin_baseline(existing_policy: str) -> str:
     """Ensure the policy contains a functional admin baseline."""
 
     lines = existing_policy.splitlines()
-    has_admin_group = any(ln.strip().startswith("g, admin, role:admin") for ln in lines)
-    has_admin_policies = any(ln.strip().startswith("p, role:admin,") for ln in lines)
+    has_admin_group = False
+    has_admin_policies = False
+    # Single scan for both markers; stop as soon as both are found
+    for ln in lines:
+        stripped = ln.strip()
+        if stripped.startswith("g, admin, role:admin"):
+            has_admin_group = True
+        elif stripped.startswith("p, role:admin,"):
+            has_admin_policies = True
+        if has_admin_group and has_admin_policies:
+            break
 
     if not has_admin_group:
         lines.insert(0, "g, admin, role:admin")
@@ -115,7 +128,7 @@ async def _load_rbac_configmap(timeout: int) -> tuple[Dict[str, Any], Optional[D
         return res, None, "empty ConfigMap payload"
 
     try:
-        parsed = json.loads(stdout)
+        parsed = loads(stdout)
     except json.JSONDecodeError as exc:  # pragma: no cover - defensive
         return res, None, f"failed to parse ConfigMap JSON: {exc}"
 
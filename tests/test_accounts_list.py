@@ -20,3 +20,56 @@ async def test_accounts_list_json(monkeypatch):
         r = await ac.get("/accounts/list", headers=headers)
         assert r.status_code == 200
         assert r.json()["data"]["items"][0]["name"] == "alice"
+
+
+@pytest.mark.asyncio
+async def test_accounts_list_cached_between_calls(monkeypatch):
+    calls = []
+
+    async def fake_run_cmd(cmd, **kwargs):
+        calls.append(cmd)
+        return {"exit_code": 0, "stdout": '{"items":[{"name":"bob"}]}', "stderr": "", "command": " ".join(cmd)}
+
+    from app import app as app_module
+    monkeypatch.setattr(app_module, "run_cmd", fake_run_cmd)
+    monkeypatch.setattr(app_module, "_ACCOUNTS_CACHE_TTL", 60.0)
+    app_module._invalidate_accounts_cache()
+
+    headers = {"X-Admin-Key": "changeme"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        r1 = await ac.get("/accounts/list", headers=headers)
+        r2 = await ac.get("/accounts/list", headers=headers)
+        assert r1.json() == r2.json()
+        assert len(calls) == 1
+
+        app_module._invalidate_accounts_cache()
+        await ac.get("/accounts/list", headers=headers)
+        assert len(calls) == 2
+    app_module._invalidate_accounts_cache()
+
+
+@pytest.mark.asyncio
+async def test_accounts_list_not_cached_when_invalidated_mid_fetch(monkeypatch):
+    calls = []
+
+    from app import app as app_module
+
+    async def fake_run_cmd(cmd, **kwargs):
+        calls.append(cmd)
+        if len(calls) == 1:
+            # A job changing accounts finishes while this listing is in flight
+            app_module._invalidate_accounts_cache()
+        return {"exit_code": 0, "stdout": '{"items":[{"name":"bob"}]}', "stderr": "", "command": " ".join(cmd)}
+
+    monkeypatch.setattr(app_module, "run_cmd", fake_run_cmd)
+    monkeypatch.setattr(app_module, "_ACCOUNTS_CACHE_TTL", 60.0)
+    app_module._invalidate_accounts_cache()
+
+    headers = {"X-Admin-Key": "changeme"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        await ac.get("/accounts/list", headers=headers)
+        await ac.get("/accounts/list", headers=headers)
+    assert len(calls) == 2
+    app_module._invalidate_accounts_cache()
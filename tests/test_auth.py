@@ -0,0 +1,44 @@
+import httpx
+import pytest
+
+import app.app as app_module
+
+app = app_module.app
+
+
+@pytest.mark.asyncio
+async def test_admin_key_required():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        assert (await ac.get("/jobs/missing")).status_code == 401
+        r = await ac.get("/jobs/missing", headers={"X-Admin-Key": "wrong"})
+        assert r.status_code == 401
+        r = await ac.get("/jobs/missing", headers={"X-Admin-Key": "changeme"})
+        assert r.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_admin_key_with_kid(monkeypatch):
+    monkeypatch.setattr(app_module, "ADMIN_API_KEYS", {"k1": "secret-1"})
+    monkeypatch.setattr(app_module, "_ADMIN_API_KEYS_DIGESTS", {"k1": app_module._key_digest("secret-1")})
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        ok = {"X-Admin-Key": "secret-1", "X-Admin-Key-Id": "k1"}
+        assert (await ac.get("/jobs/missing", headers=ok)).status_code == 404
+        bad_kid = {"X-Admin-Key": "secret-1", "X-Admin-Key-Id": "k2"}
+        assert (await ac.get("/jobs/missing", headers=bad_kid)).status_code == 401
+        no_kid = {"X-Admin-Key": "secret-1"}
+        assert (await ac.get("/jobs/missing", headers=no_kid)).status_code == 401
+
+
+def test_non_object_admin_keys_json_is_ignored():
+    import os
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    env = {**os.environ, "ADMIN_API_KEYS_JSON": '["a"]'}
+    code = "import app.app as m; assert m.ADMIN_API_KEYS is None and m._ADMIN_API_KEYS_DIGESTS == {}"
+    root = Path(__file__).resolve().parents[1]
+    subprocess.run([sys.executable, "-c", code], cwd=root, env=env, check=True)
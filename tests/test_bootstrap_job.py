@@ -80,6 +80,7 @@ async def test_ensure_namespace_unknown_flag(monkeypatch):
         return {"exit_code": 0, "stdout": "ok", "stderr": "", "command": " ".join(cmd)}
 
     monkeypatch.setattr(app_module, "run_cmd", fake_run_cmd)
+    monkeypatch.setattr(app_module, "_legacy_mysql_flag", {})
 
     req = app_module.BootstrapRequest(username="bob")
     outcome = await app_module._ensure_namespace(req, "bob")
@@ -100,6 +100,7 @@ async def test_update_namespace_operators_with_fallback(monkeypatch):
     from app import app as app_module
 
     monkeypatch.setattr(app_module, "run_cmd", fake_run_cmd)
+    monkeypatch.setattr(app_module, "_legacy_mysql_flag", {})
 
     headers = {"X-Admin-Key": "changeme"}
     transport = httpx.ASGITransport(app=app)
@@ -119,3 +120,77 @@ async def test_update_namespace_operators_with_fallback(monkeypatch):
         assert body["namespace"] == "alice-ns"
         step_names = [s.get("name") for s in body.get("steps", [])]
         assert "update_namespace_operators" in step_names
+
+
+@pytest.mark.asyncio
+async def test_mysql_flag_form_is_remembered(monkeypatch):
+    calls = []
+
+    async def fake_run_cmd(cmd, **kwargs):
+        calls.append(cmd[-1])
+        if cmd[-1].startswith("--operator.mysql"):
+            return {"exit_code": 1, "stdout": "", "stderr": "unknown flag: --operator.mysql", "command": " ".join(cmd)}
+        return {"exit_code": 0, "stdout": "ok", "stderr": "", "command": " ".join(cmd)}
+
+    from app import app as app_module
+
+    monkeypatch.setattr(app_module, "run_cmd", fake_run_cmd)
+    monkeypatch.setattr(app_module, "_legacy_mysql_flag", {})
+
+    req = app_module.NamespaceOperatorsUpdate(namespace="alice-ns", operators={"xtradb_cluster": True})
+    first = await app_module._update_namespace_operators_once(req)
+    second = await app_module._update_namespace_operators_once(req)
+
+    assert first.succeeded and second.succeeded
+    assert second.meta["used_legacy_cli"] is True
+    assert calls == [
+        "--operator.mysql=false",
+        "--operator.xtradb-cluster=true",
+        "--operator.xtradb-cluster=true",
+    ]
+
+
+def test_conflict_backoff_grows_and_is_capped():
+    from app.app import _OPERATORS_RETRY_BASE, _OPERATORS_RETRY_CAP, _conflict_backoff
+
+    for attempt in (1, 2, 3):
+        delay = _conflict_backoff(attempt)
+        base = min(_OPERATORS_RETRY_BASE * 2 ** (attempt - 1), _OPERATORS_RETRY_CAP)
+        assert base <= delay <= min(base * 1.5, _OPERATORS_RETRY_CAP)
+    assert _conflict_backoff(20) == _OPERATORS_RETRY_CAP
+
+
+@pytest.mark.asyncio
+async def test_namespace_lock_serializes_and_cleans_up():
+    from app.app import _namespace_lock, _ns_locks
+
+    active = {"now": 0, "max": 0}
+
+    async def worker():
+        async with _namespace_lock("team-a"):
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+            await asyncio.sleep(0.01)
+            active["now"] -= 1
+
+    await asyncio.gather(worker(), worker(), worker())
+    assert active["max"] == 1
+    assert "team-a" not in _ns_locks
+
+
+@pytest.mark.asyncio
+async def test_namespace_queue_does_not_hold_job_slot():
+    from app import app as app_module
+
+    ran = []
+
+    async def job():
+        ran.append(True)
+
+    async with app_module._namespace_lock("team-b"):
+        task = asyncio.create_task(app_module._run_bounded_in_namespace("team-b", job))
+        await asyncio.sleep(0.01)
+        assert ran == []
+        assert app_module._JOB_SEM._value == app_module._MAX_CONCURRENT_JOBS
+    await task
+    assert ran == [True]
@@ -0,0 +1,165 @@
+import asyncio
+import sys
+import time
+
+import pytest
+
+from app.execs import run_cli
+
+
+@pytest.mark.asyncio
+async def test_run_cli_success():
+    res = await run_cli([sys.executable, "-c", "print('hello')"], timeout=10)
+    assert res["exit_code"] == 0
+    assert res["stdout"].strip() == "hello"
+
+
+@pytest.mark.asyncio
+async def test_run_cli_timeout_returns_without_retrying():
+    start = time.perf_counter()
+    res = await run_cli(
+        [sys.executable, "-c", "import time; time.sleep(30)"],
+        timeout=1,
+        retries=2,
+        backoff_seconds=0,
+    )
+    assert res["exit_code"] == 124
+    assert "timed out" in res["stderr"]
+    assert time.perf_counter() - start < 10
+
+
+@pytest.mark.asyncio
+async def test_run_cli_caps_large_output_and_feeds_stdin():
+    script = "import sys; data = sys.stdin.read(); sys.stdout.write('START' + 'x' * 200000 + data)"
+    res = await run_cli([sys.executable, "-c", script], input_text="END", timeout=10)
+    assert res["exit_code"] == 0
+    assert res["stdout"].startswith("START")
+    assert res["stdout"].endswith("END")
+    assert "<truncated 192008 bytes>" in res["stdout"]
+    assert len(res["stdout"]) < 8100
+
+
+@pytest.mark.asyncio
+async def test_run_cmd_respects_job_deadline():
+    from app.execs import run_cmd, set_job_deadline
+
+    async def job():
+        set_job_deadline(0.5)
+        return await run_cmd([sys.executable, "-c", "print('never')"], timeout=60)
+
+    res = await asyncio.create_task(job())
+    assert res["exit_code"] == 124
+    assert "deadline exceeded" in res["stderr"]
+
+
+@pytest.mark.asyncio
+async def test_run_bounded_resets_job_deadline():
+    from app.app import _run_bounded
+    from app.execs import _job_deadline
+
+    seen = []
+
+    async def job():
+        seen.append(_job_deadline.get())
+
+    await _run_bounded(job)
+    assert seen[0] is not None
+    assert _job_deadline.get() is None
+
+
+@pytest.mark.asyncio
+async def test_cancelled_run_cli_reaps_child_and_is_labelled_cancelled(monkeypatch):
+    from app import execs
+
+    labels = []
+
+    class _Child:
+        def __init__(self, label):
+            labels.append(label)
+
+        def inc(self):
+            pass
+
+    monkeypatch.setattr(execs, "CLI_CALLS", object())
+    monkeypatch.setattr(execs, "_cli_calls_child", lambda tool, label: _Child(label))
+
+    task = asyncio.create_task(run_cli([sys.executable, "-c", "import time; time.sleep(30)"], timeout=60))
+    await asyncio.sleep(0.5)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert labels == ["cancelled"]
+
+
+@pytest.mark.asyncio
+async def test_timeout_does_not_wait_for_grandchild_holding_pipes(monkeypatch):
+    from app import execs
+
+    monkeypatch.setattr(execs, "_KILL_WAIT_SECONDS", 0.5)
+    start = time.perf_counter()
+    res = await run_cli(["sh", "-c", "sleep 20 & sleep 20"], timeout=1)
+    assert res["exit_code"] == 124
+    assert time.perf_counter() - start < 5
+
+
+@pytest.mark.asyncio
+async def test_cancel_does_not_wait_for_grandchild_holding_pipes(monkeypatch):
+    from app import execs
+
+    monkeypatch.setattr(execs, "_KILL_WAIT_SECONDS", 0.5)
+    task = asyncio.create_task(run_cli(["sh", "-c", "sleep 20 & sleep 20"], timeout=60))
+    await asyncio.sleep(0.3)
+    start = time.perf_counter()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert time.perf_counter() - start < 5
+
+
+@pytest.mark.asyncio
+async def test_kill_and_reap_gives_up_on_stuck_wait(monkeypatch):
+    from app import execs
+
+    class _StuckProc:
+        pid = 0
+        killed = False
+
+        def kill(self):
+            self.killed = True
+
+        async def wait(self):
+            await asyncio.sleep(30)
+
+    def _no_group(pid, sig):
+        raise ProcessLookupError
+
+    monkeypatch.setattr(execs, "_KILL_WAIT_SECONDS", 0.1)
+    monkeypatch.setattr(execs.os, "killpg", _no_group)
+    proc = _StuckProc()
+    start = time.perf_counter()
+    await execs._kill_and_reap(proc)
+    assert proc.killed
+    assert time.perf_counter() - start < 2
+
+
+@pytest.mark.asyncio
+async def test_job_deadline_counts_subprocess_slot_wait(monkeypatch):
+    from app import execs
+    from app.execs import run_cmd, set_job_deadline
+
+    sem = asyncio.Semaphore(1)
+    monkeypatch.setattr(execs, "_SUBPROC_SEM", sem)
+
+    async def job():
+        set_job_deadline(1.5)
+        return await run_cmd([sys.executable, "-c", "import time; time.sleep(5)"], timeout=60)
+
+    await sem.acquire()
+    task = asyncio.create_task(job())
+    await asyncio.sleep(1)
+    start = time.perf_counter()
+    sem.release()
+    res = await task
+    assert res["exit_code"] == 124
+    assert "deadline exceeded" in res["stderr"]
+    assert time.perf_counter() - start < 0.5
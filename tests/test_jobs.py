@@ -0,0 +1,25 @@
+import json
+
+import pytest
+
+from app.jobs import JobStore
+
+
+@pytest.mark.asyncio
+async def test_only_finished_jobs_keep_encoded_bodies():
+    store = JobStore()
+    job = await store.create()
+
+    assert json.loads(await store.serialize_json(job.job_id))["status"] == "queued"
+    await store.update(job.job_id, status="running")
+    assert store._encoded == {}
+
+    await store.update(job.job_id, status="succeeded", result={"ok": True})
+    first = await store.serialize_json(job.job_id)
+    assert await store.serialize_json(job.job_id) is first
+    assert json.loads(first)["status"] == "succeeded"
+    assert json.loads(store.result_json(job)) == {"ok": True}
+    # One encoded copy: the result body is a slice of the status body
+    assert json.loads(first) == await store.serialize(job.job_id)
+    assert store.result_json(job) in first
+    assert await store.serialize_json("missing") is None
@@ -0,0 +1,21 @@
+import json
+import logging
+import queue
+import sys
+
+from app.logging_utils import JSONFormatter, _PassthroughQueueHandler
+
+
+def test_queued_exception_keeps_message_and_traceback_separate():
+    handler = _PassthroughQueueHandler(queue.SimpleQueue())
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        record = logging.LogRecord("t", logging.ERROR, __file__, 1, "job %s failed", ("j1",), sys.exc_info())
+
+    prepared = handler.prepare(record)
+    payload = json.loads(JSONFormatter().format(prepared))
+
+    assert payload["message"] == "job j1 failed"
+    assert payload["exc_info"].startswith("Traceback")
+    assert "ZeroDivisionError" in payload["exc_info"]
@@ -0,0 +1,18 @@
+import pytest
+
+from app.app import _mask_command
+
+
+@pytest.mark.parametrize(
+    "cmd,expected",
+    [
+        ("everestctl accounts create -u alice -p s3cret", "everestctl accounts create -u alice -p ********"),
+        ("everestctl accounts set-password --password s3cret", "everestctl accounts set-password --password ********"),
+        ("tool --password=s3cret --verbose", "tool --password=******** --verbose"),
+        ("kubectl get namespaces -o json", "kubectl get namespaces -o json"),
+        ("tool --passwordless run", "tool --passwordless run"),
+    ],
+)
+def test_mask_command(cmd, expected):
+    assert _mask_command(cmd) == expected
+
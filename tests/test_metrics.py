@@ -0,0 +1,20 @@
+import httpx
+import pytest
+
+from app.app import app
+
+
+@pytest.mark.asyncio
+async def test_metrics_plain_and_gzip():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        plain = await ac.get("/metrics", headers={"Accept-Encoding": "identity"})
+        assert plain.status_code == 200
+        assert "content-encoding" not in plain.headers
+        assert "everest_api_cli_calls_total" in plain.text
+
+        gz = await ac.get("/metrics", headers={"Accept-Encoding": "gzip"})
+        assert gz.status_code == 200
+        assert gz.headers.get("content-encoding") == "gzip"
+        # httpx transparently decodes the gzip body
+        assert gz.text == plain.text
@@ -0,0 +1,32 @@
+import logging
+
+from app import app as app_module
+
+
+def test_step_log_skips_previews_above_info(monkeypatch):
+    def boom(*args, **kwargs):
+        raise AssertionError("preview built while INFO is disabled")
+
+    monkeypatch.setattr(app_module, "_preview_text", boom)
+    previous = app_module.logger.level
+    app_module.logger.setLevel(logging.WARNING)
+    try:
+        step_log = app_module.StepLog("job-1")
+        step_log.add({"name": "ok", "exit_code": 0, "stdout": "x" * 5000})
+        step_log.add({"name": "bad", "exit_code": 1, "stderr": "y" * 5000})
+    finally:
+        app_module.logger.setLevel(previous)
+    assert step_log.records == []
+
+
+def test_step_log_batches_successes_and_flushes(monkeypatch):
+    emitted = []
+    monkeypatch.setattr(app_module, "_log_job_step", lambda job_id, step: emitted.append(step["name"]))
+
+    step_log = app_module.StepLog("job-1", flush_every=2)
+    step_log.add({"name": "a", "exit_code": 0, "stdout": "ok"})
+    step_log.add({"name": "bad", "exit_code": 1, "stderr": "boom"})
+    assert emitted == ["bad"]
+    assert [r["step_name"] for r in step_log.records] == ["a"]
+    step_log.add({"name": "b", "exit_code": 0})
+    assert step_log.records == []
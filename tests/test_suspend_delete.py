@@ -69,6 +69,7 @@ Usage:
     from app import app as app_module
 
     monkeypatch.setattr(app_module, "run_cmd", fake_run_cmd)
+    monkeypatch.setattr(app_module, "_last_good_deactivate", {})
 
     headers = {"X-Admin-Key": "changeme"}
     transport = httpx.ASGITransport(app=app)
@@ -139,3 +140,134 @@ async def test_delete_user_flow_with_fallbacks(monkeypatch):
         step_names = [s.get("name") for s in body.get("steps", [])]
         assert any(name in {"delete_namespace", "remove_namespace"} for name in step_names)
         assert "delete_account" in step_names
+
+
+@pytest.mark.asyncio
+async def test_suspend_skips_unknown_verbs_without_help_probe(monkeypatch):
+    attempted = []
+
+    async def fake_run_cmd(cmd, **kwargs):
+        c = " ".join(cmd)
+        assert cmd != ["everestctl", "accounts", "--help"]
+        if cmd[:2] == ["everestctl", "accounts"]:
+            attempted.append(cmd[2])
+            if cmd[2] == "suspend":
+                return {"exit_code": 0, "stdout": "suspended", "stderr": "", "command": c}
+            return {"exit_code": 1, "stdout": "", "stderr": f'unknown command "{cmd[2]}"', "command": c}
+        return {"exit_code": 0, "stdout": "ok", "stderr": "", "command": c}
+
+    from app import app as app_module
+
+    monkeypatch.setattr(app_module, "run_cmd", fake_run_cmd)
+    monkeypatch.setattr(app_module, "_last_good_deactivate", {})
+
+    headers = {"X-Admin-Key": "changeme"}
+    payload = {"username": "bob", "namespace": "team-bob", "revoke_rbac": False}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        r = await ac.post("/accounts/suspend", json=payload, headers=headers)
+        job_id = r.json()["job_id"]
+        await _wait_for_job(ac, job_id, headers)
+        body = await _fetch_job_result(ac, job_id, headers)
+
+    assert attempted == ["deactivate", "disable", "suspend"]
+    variants = [s.get("variant") for s in body["steps"] if s.get("name") == "deactivate_account"]
+    assert variants == ["suspend"]
+    assert "account deactivated" in body["summary"]
+
+
+@pytest.mark.asyncio
+async def test_suspend_tries_last_good_verb_first(monkeypatch):
+    attempted = []
+
+    async def fake_run_cmd(cmd, **kwargs):
+        c = " ".join(cmd)
+        if cmd[:2] == ["everestctl", "accounts"]:
+            attempted.append(cmd[2])
+            ok = cmd[2] == "lock"
+            return {"exit_code": 0 if ok else 1, "stdout": "", "stderr": "" if ok else "unknown command", "command": c}
+        return {"exit_code": 0, "stdout": "ok", "stderr": "", "command": c}
+
+    from app import app as app_module
+
+    monkeypatch.setattr(app_module, "run_cmd", fake_run_cmd)
+    monkeypatch.setattr(app_module, "_last_good_deactivate", {})
+
+    headers = {"X-Admin-Key": "changeme"}
+    payload = {"username": "bob", "namespace": "team-bob", "revoke_rbac": False}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        for _ in range(2):
+            r = await ac.post("/accounts/suspend", json=payload, headers=headers)
+            await _wait_for_job(ac, r.json()["job_id"], headers)
+
+    assert attempted == ["deactivate", "disable", "suspend", "lock", "lock"]
+
+
+@pytest.mark.asyncio
+async def test_delete_account_variants_race(monkeypatch):
+    cancelled = []
+
+    async def fake_run_cmd(cmd, **kwargs):
+        c = " ".join(cmd)
+        if cmd[:3] == ["everestctl", "accounts", "delete"]:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(c)
+                raise
+            return {"exit_code": 1, "stdout": "", "stderr": "slow", "command": c}
+        if cmd[:3] == ["everestctl", "accounts", "remove"]:
+            return {"exit_code": 0, "stdout": "removed", "stderr": "", "command": c}
+        return {"exit_code": 0, "stdout": "ok", "stderr": "", "command": c}
+
+    from app import app as app_module
+
+    monkeypatch.setattr(app_module, "run_cmd", fake_run_cmd)
+
+    headers = {"X-Admin-Key": "changeme"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        r = await ac.post("/accounts/delete", json={"username": "bob", "namespace": "team-bob"}, headers=headers)
+        job_id = r.json()["job_id"]
+        await _wait_for_job(ac, job_id, headers)
+        body = await _fetch_job_result(ac, job_id, headers)
+
+    account_steps = [s for s in body["steps"] if s.get("name") == "delete_account"]
+    assert [s["variant"] for s in account_steps] == ["remove"]
+    assert cancelled == ["everestctl accounts delete -u bob"]
+
+
+@pytest.mark.asyncio
+async def test_suspend_cancels_sibling_steps_when_one_raises(monkeypatch):
+    cancelled = []
+
+    async def fake_run_cmd(cmd, **kwargs):
+        c = " ".join(cmd)
+        if cmd[:2] == ["kubectl", "scale"]:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(c)
+                raise
+        return {"exit_code": 0, "stdout": "ok", "stderr": "", "command": c}
+
+    async def broken_revoke(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        raise RuntimeError("rbac exploded")
+
+    from app import app as app_module
+
+    monkeypatch.setattr(app_module, "run_cmd", fake_run_cmd)
+    monkeypatch.setattr(app_module, "revoke_user_in_rbac_configmap", broken_revoke)
+    monkeypatch.setattr(app_module, "_last_good_deactivate", {})
+
+    headers = {"X-Admin-Key": "changeme"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        r = await ac.post("/accounts/suspend", json={"username": "bob", "namespace": "team-bob"}, headers=headers)
+        job_id = r.json()["job_id"]
+        data = await _wait_for_job(ac, job_id, headers)
+
+    assert data["status"] == "failed"
+    assert len(cancelled) == 1
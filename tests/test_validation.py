@@ -0,0 +1,62 @@
+import httpx
+import pytest
+
+from app.app import (
+    BootstrapRequest,
+    NamespaceResourceUpdate,
+    PasswordChangeRequest,
+    SuspendUserRequest,
+    app,
+)
+
+
+@pytest.mark.parametrize("value", ["alice", "a", "team-1", "0abc"])
+def test_valid_k8s_names(value):
+    assert BootstrapRequest(username=value).username == value
+    assert NamespaceResourceUpdate(namespace=value).namespace == value
+
+
+@pytest.mark.parametrize("value", ["Alice", "-alice", "alice-", "al_ice", "alice\n", "", "a" * 64])
+def test_invalid_k8s_names(value):
+    with pytest.raises(ValueError):
+        BootstrapRequest(username=value)
+    with pytest.raises(ValueError):
+        NamespaceResourceUpdate(namespace=value)
+
+
+def test_namespace_denylist_only_applies_to_namespace():
+    assert BootstrapRequest(username="default").username == "default"
+    with pytest.raises(ValueError):
+        BootstrapRequest(username="alice", namespace="kube-system")
+    with pytest.raises(ValueError):
+        NamespaceResourceUpdate(namespace="default")
+
+
+def test_namespace_prefixes(monkeypatch):
+    import app.app as app_module
+
+    monkeypatch.setattr(app_module, "_ALLOWED_NS_PREFIXES", ("team-", "tenant-"))
+    assert SuspendUserRequest(username="bob", namespace="team-a").namespace == "team-a"
+    assert SuspendUserRequest(username="bob").namespace is None
+    with pytest.raises(ValueError):
+        SuspendUserRequest(username="bob", namespace="other")
+
+
+@pytest.mark.parametrize("username", ["Alice", "bob\n", "-bob"])
+def test_request_models_enforce_rfc1123(username):
+    with pytest.raises(ValueError):
+        PasswordChangeRequest(username=username, new_password="pw")
+
+
+@pytest.mark.asyncio
+async def test_api_rejects_invalid_namespace_with_422():
+    headers = {"X-Admin-Key": "changeme"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        r = await ac.post(
+            "/accounts/suspend",
+            json={"username": "bob", "namespace": "kube-system"},
+            headers=headers,
+        )
+    assert r.status_code == 422
+    assert r.json()["detail"][0]["loc"] == ["body", "namespace"]